@@ -14,7 +14,7 @@ from quotexapi.config import (
     email,
     password
 )
-from quotexapi.stable_api import Quotex
+from quotexapi.stable_api import Quotex, CandlesWindowError
 from quotexapi.utils.processor import process_candles, get_color
 
 __author__ = "Cleiton Leonel Creton"
@@ -229,23 +229,25 @@ async def buy_multiple(orders=10):
         {"amount": 50, "asset": "GBPJPY_otc", "direction": "put", "duration": 60},
     ]
     check_connect, message = await client.connect()
-    for i in range(0, orders):
-        print("\n/", 80 * "=", "/", end="\n")
-        print(f"ABRINDO ORDEM: {i + 1}")
-        order = random.choice(order_list)
-        print(order)
-        if check_connect:
-            # client.change_account("REAL")
+    if check_connect:
+        # client.change_account("REAL")
+        async def open_order(i, order):
             asset_name, asset_data = await client.get_available_asset(order['asset'], force_open=True)
-            print(asset_name, asset_data)
-            if asset_data[2]:
-                print("OK: Asset está aberto.")
-                status, buy_info = await client.buy(**order)
-                print(status, buy_info)
-            else:
-                print("ERRO: Asset está fechado.")
-            print("Saldo corrente: ", await client.get_balance())
-            await asyncio.sleep(2)
+            if not asset_data[2]:
+                print(f"ORDEM {i + 1}: ERRO: Asset {asset_name} está fechado.")
+                return False, None
+            order["asset"] = asset_name
+            status, buy_info = await client.buy(**order)
+            print(f"ORDEM {i + 1}: {order}", status, buy_info)
+            return status, buy_info
+
+        print("\n/", 80 * "=", "/", end="\n")
+        print(f"ABRINDO {orders} ORDENS")
+        results = await asyncio.gather(
+            *[open_order(i, dict(random.choice(order_list))) for i in range(orders)]
+        )
+        print(f"Ordens abertas: {sum(1 for status, _ in results if status)} de {orders}")
+        print("Saldo corrente: ", await client.get_balance())
 
     print("\n/", 80 * "=", "/", end="\n")
 
@@ -289,6 +291,7 @@ async def assets_open():
     check_connect, reason = await client.connect()
     if check_connect:
         print("Asset Open")
+        await client.get_instruments()
         for i in client.get_all_asset_name():
             print(i[1])
             print(i[1], await client.check_asset_open(i[0]))
@@ -348,16 +351,21 @@ async def get_candle_progressive():
         period = 60  # in seconds [5, 10, 15, 30, 60, 120, 180, 240, 300, 600, 900, 1800, 3600, 14400, 86400]
         days_of_candle = 1
         list_candles = []
-        size = days_of_candle * 24
         timestamp = get_timestamp_days_ago(days_of_candle)
-        end_from_time = (int(timestamp) - int(timestamp) % period) + offset
-        for i in range(size):
-            epoch_candle = timestamp_to_date(end_from_time)
-            print(epoch_candle)
-            candles = await client.get_candles(asset, end_from_time, offset, period)
-            if candles:
-                end_from_time = end_from_time + offset
-                list_candles.append(candles)
+        end_from_time = time.time()
+        try:
+            async for candle in client.iter_candles_range(
+                    asset,
+                    timestamp,
+                    end_from_time,
+                    period,
+                    window=offset,
+                    concurrency=8
+            ):
+                print(timestamp_to_date(candle["time"]), candle)
+                list_candles.append(candle)
+        except CandlesWindowError as e:
+            print(f"Histórico incompleto: {e}")
 
         print(list_candles)
 
@@ -0,0 +1,101 @@
+"""Microbenchmark of the websocket frame decoder backends.
+
+Usage:
+    python examples/benchmark_decoder.py
+    python examples/benchmark_decoder.py --frames frames.jsonl
+
+Without `--frames` it builds frames shaped like the recorded platform
+payloads: `instruments/list`, `history/list/v2`, `quotes/stream` and
+`s_orders/close`. A frames file holds one `{"event": ..., "payload": ...}`
+JSON object per line, the payload being the frame JSON as received.
+"""
+import sys
+import json
+import random
+import timeit
+import argparse
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from quotexapi.ws.decoder import FrameDecoder, BACKENDS  # noqa: E402
+
+
+def sample_frames():
+    now = 1700000000
+    instruments = [
+        [i, f"ASSET{i}_otc", f"Asset {i} (OTC)", "currency", 2, 80 + i % 10, 60, 30, 3, 1, 0, 0, [], 0,
+         True, [{"time": 60}, {"time": 120}], 0, 0, 85, 0, [], "", 0, 0, 0, 82, 84, 0, 0, 0, 1]
+        for i in range(250)
+    ]
+    history = {
+        "asset": "EURUSD_otc",
+        "period": 60,
+        "history": [[now + i * 0.5, 1.1 + random.random() / 100, 0] for i in range(2000)],
+        "candles": [
+            [now + i * 60, 1.1, 1.101, 1.102, 1.099, 120] for i in range(1000)
+        ],
+    }
+    quotes = [["EURUSD_otc", now + i * 0.25, 1.1 + random.random() / 100, 0] for i in range(5)]
+    deals = {
+        "profit": 8.5,
+        "deals": [
+            {"id": f"deal-{i}", "asset": "EURUSD_otc", "amount": 10, "profit": 8.5,
+             "openTime": "2024-01-01 10:00:00", "closeTime": "2024-01-01 10:01:00", "command": 0}
+            for i in range(10)
+        ]
+    }
+    return [
+        ("instruments/list", json.dumps(instruments)),
+        ("history/list/v2", json.dumps(history)),
+        ("quotes/stream", json.dumps(quotes)),
+        ("s_orders/close", json.dumps(deals)),
+    ]
+
+
+def load_frames(path):
+    frames = []
+    with open(path, encoding="utf-8") as file:
+        for line in file:
+            if line.strip():
+                item = json.loads(line)
+                frames.append((item["event"], item["payload"]))
+    return frames
+
+
+def bench(decoder, message, event, number):
+    def run():
+        decoder.convert(event, decoder.decode_binary(message))
+    return min(timeit.repeat(run, number=number, repeat=5)) / number
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--frames", help="JSON lines file of recorded frames")
+    parser.add_argument("--number", type=int, default=200, help="decodes per measurement")
+    args = parser.parse_args()
+
+    frames = load_frames(args.frames) if args.frames else sample_frames()
+    decoders = {}
+    for backend in BACKENDS:
+        try:
+            decoders[backend] = FrameDecoder(backend)
+        except ImportError:
+            print(f"{backend}: not installed, skipped")
+
+    print(f"{'event':<20}{'bytes':>10}" + "".join(f"{backend:>12}" for backend in decoders) + f"{'speedup':>10}")
+    for event, payload in frames:
+        message = b"\x04" + payload.encode()
+        timings = {
+            backend: bench(decoder, message, event, args.number) for backend, decoder in decoders.items()
+        }
+        speedup = timings["json"] / min(timings.values())
+        print(
+            f"{event:<20}{len(message):>10}"
+            + "".join(f"{timing * 1e6:>10.1f}us" for timing in timings.values())
+            + f"{speedup:>9.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
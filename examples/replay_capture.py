@@ -0,0 +1,46 @@
+"""Replay a websocket capture offline through the client message path.
+
+Usage:
+    python examples/replay_capture.py session.qxcap
+    python examples/replay_capture.py session.qxcap --speed 10
+    python examples/replay_capture.py session.qxcap --speed 0 --backend json
+
+Record the capture with `client.start_capture("session.qxcap")` after
+`connect`. `--speed 0` replays as fast as possible, which benchmarks the
+decoding and handlers of every frame without a network.
+"""
+import sys
+import asyncio
+import argparse
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from quotexapi.api import QuotexAPI  # noqa: E402
+from quotexapi.ws.client import WebsocketClient  # noqa: E402
+from quotexapi.ws.capture import FrameReplayer  # noqa: E402
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("capture", help="capture file written by FrameRecorder")
+    parser.add_argument("--speed", type=float, default=1.0, help="replay speed, 0 for full speed")
+    parser.add_argument("--backend", help="JSON backend: orjson, msgspec or json")
+    parser.add_argument("--host", default="qxbroker.com")
+    args = parser.parse_args()
+
+    api = QuotexAPI(args.host, "", "", "pt")
+    api.json_backend = args.backend
+    api.websocket_client = WebsocketClient(api)
+    stats = await FrameReplayer(args.capture).replay(api.websocket_client, speed=args.speed or None)
+
+    received = stats["received"]
+    duration = stats["duration"]
+    print(f"{received} frames received, {stats['sent']} sent, replayed in {duration:.3f}s", end="")
+    print(f" ({received / duration:.0f} frames/s)" if duration else "")
+    for event, item in sorted(api.frame_counters.stats()["received"].items()):
+        print(f"{event:<30}{item['frames']:>10}{item['bytes']:>14}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -1,6 +1,5 @@
 """Module for Quotex websocket."""
 import os
-import sys
 import time
 import json
 import ssl
@@ -8,9 +7,12 @@ import urllib3
 import requests
 import certifi
 import logging
+import asyncio
 import platform
+import itertools
 import threading
-from . import global_value
+from .global_value import SessionState
+from .expiration import get_timestamp
 from .http.login import Login
 from .http.logout import Logout
 from .http.settings import Settings
@@ -24,8 +26,16 @@ from .ws.objects.timesync import TimeSync
 from .ws.objects.candles import Candles
 from .ws.objects.profile import Profile
 from .ws.objects.listinfodata import ListInfoData
+from .ws.objects.ticks import TickBuffer
+from .ws.objects.instruments import Instruments
 from .ws.client import WebsocketClient
-from collections import defaultdict
+from .ws.pending import PendingResponses
+from .ws.router import MessageRouter
+from .ws.send_queue import SendQueue
+from .ws.heartbeat import Heartbeat
+from .ws.transport import TRANSPORTS, TRANSPORT_ASYNCIO
+from .utils.metrics import Histogram, OrderLatencyTracker, FrameCounters
+from collections import defaultdict, deque
 
 urllib3.disable_warnings()
 logger = logging.getLogger(__name__)
@@ -53,7 +63,6 @@ def nested_dict(n, type):
 
 class QuotexAPI(object):
     """Class for communication with Quotex API."""
-    socket_option_opened = {}
     buy_id = None
     trace_ws = False
     buy_expiration = None
@@ -67,10 +76,9 @@ class QuotexAPI(object):
     profit_in_operation = None
     sold_options_respond = None
     sold_digital_options_respond = None
-    listinfodata = ListInfoData()
-    timesync = TimeSync()
-    candles = Candles()
-    profile = Profile()
+    realtime_price_capacity = 10000
+    json_backend = None
+    compression = True
 
     def __init__(self,
                  host,
@@ -80,7 +88,8 @@ class QuotexAPI(object):
                  email_pass=None,
                  proxies=None,
                  resource_path=None,
-                 user_data_dir="."):
+                 user_data_dir=".",
+                 transport="thread"):
         """
         :param str host: The hostname or ip address of a Quotex server.
         :param str username: The username of a Quotex server.
@@ -89,18 +98,29 @@ class QuotexAPI(object):
         :param str email_pass: The password of a Email.
         :param proxies: The proxies of a Quotex server.
         :param user_data_dir: The path browser user data dir.
+        :param str transport: The websocket transport, "thread" or "asyncio".
         """
+        if transport not in TRANSPORTS:
+            raise ValueError(f"Unknown websocket transport: {transport}")
         self.host = host
         self.https_url = f"https://{host}"
         self.wss_url = f"wss://ws2.{host}/socket.io/?EIO=3&transport=websocket"
         self.wss_message = None
+        self.state = SessionState()
+        self.socket_option_opened = {}
+        self.listinfodata = ListInfoData()
+        self.timesync = TimeSync()
+        self.candles = Candles()
+        self.profile = Profile()
+        self.instrument_catalogue = Instruments()
+        self.session_file = "session.json"
         self.websocket_thread = None
+        self.websocket_task = None
         self.websocket_client = None
         self.set_ssid = None
         self.object_id = None
         self.token_login2fa = None
         self.is_logged = False
-        self._temp_status = ""
         self.username = username
         self.password = password
         self.email_pass = email_pass
@@ -108,6 +128,7 @@ class QuotexAPI(object):
         self.user_data_dir = user_data_dir
         self.proxies = proxies
         self.lang = lang
+        self.transport = transport
         self.settings_list = {}
         self.signal_data = {}
         self.get_candle_data = {}
@@ -115,9 +136,27 @@ class QuotexAPI(object):
         self.candle_v2_data = {}
         self.realtime_price = {}
         self.real_time_candles = {}
+        self.candle_aggregators = {}
+        self.market_data = None
+        self.chart_settings = {}
+        self.chart_settings_key = None
         self.realtime_sentiment = {}
         self.top_list_leader = {}
         self.session_data = {}
+        self.pending = PendingResponses()
+        self.request_ids = itertools.count(get_timestamp() * 1000)
+        self.order_requests = deque()
+        self.router = MessageRouter()
+        self.send_queue = SendQueue(self.write_websocket_frame)
+        self.order_latency = OrderLatencyTracker()
+        self.send_queue.on_sent = self.order_latency.frame_sent
+        self.time_to_data = Histogram()
+        self.frame_counters = FrameCounters()
+        self.heartbeat = Heartbeat(self)
+        self.disconnected_at = None
+        self.subscriptions = None
+        self.standby = None
+        self.frame_recorder = None
         self.browser = Browser()
         self.browser.set_headers()
 
@@ -129,8 +168,15 @@ class QuotexAPI(object):
         """
         return self.websocket_client.wss
 
+    def next_request_id(self):
+        """Get an id unique in this session, used as request `index` or `requestId`."""
+        return next(self.request_ids)
+
     def subscribe_realtime_candle(self, asset, period):
-        self.realtime_price[asset] = []
+        if self.market_data is not None:
+            return self.market_data.acquire(self, asset, period)
+        if asset not in self.realtime_price:
+            self.realtime_price[asset] = TickBuffer(self.realtime_price_capacity)
         payload = {
             "asset": asset,
             "period": period
@@ -139,14 +185,20 @@ class QuotexAPI(object):
         return self.send_websocket_request(data)
 
     def follow_candle(self, asset):
+        if self.market_data is not None:
+            return
         data = f'42["depth/follow", {json.dumps(asset)}]'
         return self.send_websocket_request(data)
 
     def unfollow_candle(self, asset):
+        if self.market_data is not None:
+            return
         data = f'42["depth/unfollow", {json.dumps(asset)}]'
         return self.send_websocket_request(data)
 
     def unsubscribe_realtime_candle(self, asset):
+        if self.market_data is not None:
+            return self.market_data.release(self, asset)
         data = f'42["subfor", {json.dumps(asset)}]'
         return self.send_websocket_request(data)
 
@@ -301,20 +353,38 @@ class QuotexAPI(object):
         history = await self.get_history(account_type, page_number)
         return history.get("data", {})
 
-    def send_websocket_request(self, data, no_force_send=True):
+    def send_websocket_request(self, data, no_force_send=True, priority=None, on_sent=None, handle=None):
         """Send websocket request to Quotex server.
         :param str data: The websocket request data.
-        :param bool no_force_send: Default None.
+        :param bool no_force_send: False writes the frame now, skipping the queue.
+        :param int priority: (optional) The send queue lane, see
+            :func:`frame_priority <quotexapi.ws.send_queue.frame_priority>`.
+        :param on_sent: (optional) The callable called once the frame is written.
+        :param handle: (optional) The :class:`SendHandle
+            <quotexapi.ws.send_queue.SendHandle>` withdrawing the queued frame.
         """
-        while (global_value.ssl_Mutual_exclusion
-               or global_value.ssl_Mutual_exclusion_write) and no_force_send:
-            pass
-        global_value.ssl_Mutual_exclusion_write = True
-        self.websocket.send(data)
+        if not no_force_send:
+            self.websocket.send(data)
+            logger.debug(data)
+            if on_sent is not None:
+                on_sent()
+            return
+        self.send_queue.put(data, priority, on_sent, handle)
+
+    async def write_websocket_frame(self, data):
+        """Write one frame on the socket, used by the send queue writer."""
+        if self.transport == TRANSPORT_ASYNCIO:
+            await self.websocket.send_async(data)
+        else:
+            self.websocket.send(data)
         logger.debug(data)
-        global_value.ssl_Mutual_exclusion_write = False
 
     async def authenticate(self):
+        """Log in and take the SSID of the new session.
+
+        :returns: The tuple `(status, message)` of the login, a failed
+            login leaves the account logged out instead of exiting.
+        """
         print("Quotex Connecting...")
         status, message = await self.login(
             self.username,
@@ -323,22 +393,29 @@ class QuotexAPI(object):
             self.user_data_dir
         )
         print(message)
-        if not status:
-            sys.exit(1)
-        global_value.SSID = self.session_data.get("token")
-        self.is_logged = True
+        self.is_logged = bool(status)
+        if status:
+            self.state.SSID = self.session_data.get("token")
+        return status, message
 
-    async def start_websocket(self):
-        global_value.check_websocket_if_connect = None
-        global_value.check_websocket_if_error = False
-        global_value.websocket_error_reason = None
-        if not global_value.SSID:
-            await self.authenticate()
-        self.websocket_client = WebsocketClient(self)
+    def run_websocket(self, client):
+        """Start the transport of a websocket client.
+
+        :param client: The instance of :class:`WebsocketClient
+            <quotexapi.ws.client.WebsocketClient>`.
+        :returns: The asyncio task or the thread running the websocket.
+        """
+        if self.transport == TRANSPORT_ASYNCIO:
+            return asyncio.create_task(
+                client.wss.run_forever(
+                    ping_interval=24,
+                    ping_timeout=20,
+                    ssl_context=ssl_context
+                )
+            )
         payload = {
             "ping_interval": 24,
             "ping_timeout": 20,
-            "ping_payload": "2",
             "origin": self.https_url,
             "host": f"ws2.{self.host}",
             "sslopt": {
@@ -350,66 +427,116 @@ class QuotexAPI(object):
         }
         if platform.system() == "Linux":
             payload["sslopt"]["ssl_version"] = ssl.PROTOCOL_TLS
-        self.websocket_thread = threading.Thread(
-            target=self.websocket.run_forever,
+        thread = threading.Thread(
+            target=client.wss.run_forever,
             kwargs=payload
         )
-        self.websocket_thread.daemon = True
-        self.websocket_thread.start()
+        thread.daemon = True
+        thread.start()
+        return thread
+
+    async def start_websocket(self):
+        self.state.check_websocket_if_connect = None
+        self.state.check_websocket_if_error = False
+        self.state.websocket_error_reason = None
+        if not self.state.SSID:
+            status, message = await self.authenticate()
+            if not status:
+                return False, message
+        self.websocket_client = WebsocketClient(self)
+        self.send_queue.start()
+        self.heartbeat.start()
+        if self.transport == TRANSPORT_ASYNCIO:
+            self.websocket_task = self.run_websocket(self.websocket_client)
+        else:
+            self.websocket_thread = self.run_websocket(self.websocket_client)
         while True:
-            if global_value.check_websocket_if_error:
-                return False, global_value.websocket_error_reason
-            elif global_value.check_websocket_if_connect == 0:
+            if self.state.check_websocket_if_error:
+                return False, self.state.websocket_error_reason
+            elif self.state.check_websocket_if_connect == 0:
                 logger.debug("Websocket conexão fechada.")
                 return False, "Websocket conexão fechada."
-            elif global_value.check_websocket_if_connect == 1:
+            elif self.state.check_websocket_if_connect == 1:
                 logger.debug("Websocket conectado com sucesso!!!")
                 return True, "Websocket conectado com sucesso!!!"
-            elif global_value.check_rejected_connection == 1:
-                global_value.SSID = None
+            elif self.state.check_rejected_connection == 1:
+                self.state.SSID = None
                 logger.debug("Websocket Token Rejeitado.")
                 return True, "Websocket Token Rejeitado."
+            await asyncio.sleep(0.1)
 
-    def send_ssid(self, timeout=10):
+    async def send_ssid(self, timeout=10):
         self.wss_message = None
-        if not global_value.SSID:
+        if not self.state.SSID:
             return False
-        self.ssid(global_value.SSID)
+        self.ssid(self.state.SSID)
         start_time = time.time()
         while self.wss_message is None:
             if time.time() - start_time > timeout:
                 return False
-            time.sleep(0.5)
+            await asyncio.sleep(0.5)
         return True
 
     async def connect(self, is_demo):
         """Method for connection to Quotex API."""
         self.account_type = is_demo
-        global_value.ssl_Mutual_exclusion = False
-        global_value.ssl_Mutual_exclusion_write = False
-        if global_value.check_websocket_if_connect:
+        if self.state.check_websocket_if_connect:
             logger.info("Closing websocket connection...")
             self.close()
         check_websocket, websocket_reason = await self.start_websocket()
         if not check_websocket:
             return check_websocket, websocket_reason
-        check_ssid = self.send_ssid()
+        check_ssid = await self.send_ssid()
         if not check_ssid:
-            await self.authenticate()
-            if self.is_logged:
-                self.send_ssid()
+            status, message = await self.authenticate()
+            if not status:
+                self.close()
+                return False, message
+            await self.send_ssid()
         return check_websocket, websocket_reason
 
     async def reconnect(self):
-        """Method for connection to Quotex API."""
+        """Open a new websocket for the same session.
+
+        The SSID is reused, pending requests and deal trackers are kept and
+        the stream subscriptions are replayed.
+        """
         logger.info("Websocket Reconnection...")
-        await self.start_websocket()
+        self.close()
+        check_websocket, websocket_reason = await self.start_websocket()
+        if not check_websocket:
+            return check_websocket, websocket_reason
+        check_ssid = await self.send_ssid()
+        if not check_ssid:
+            status, message = await self.authenticate()
+            if not status:
+                return False, message
+            if not await self.send_ssid():
+                return False, "Sessão não autorizada."
+        if self.subscriptions is not None:
+            self.subscriptions.replay()
+        return check_websocket, websocket_reason
+
+    def record_time_to_data(self):
+        """Record the time from the last disconnect to the first quotes."""
+        disconnected_at = self.disconnected_at
+        if disconnected_at is not None:
+            self.disconnected_at = None
+            self.time_to_data.record(time.perf_counter() - disconnected_at)
 
     def close(self):
+        self.send_queue.pause()
+        self.send_queue.stop()
+        self.heartbeat.stop()
         if self.websocket_client:
             self.websocket.close()
-            self.websocket_thread.join()
+            if self.websocket_task:
+                self.websocket_task.cancel()
+            else:
+                self.websocket_thread.join()
         return True
 
     def websocket_alive(self):
+        if self.websocket_task:
+            return not self.websocket_task.done()
         return self.websocket_thread.is_alive()
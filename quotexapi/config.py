@@ -35,10 +35,10 @@ if not user_data_dir:
     user_data_dir = "browser/instance/quotex.default"
 
 
-def load_session(user_agent):
+def load_session(user_agent, session_file="session.json"):
     output_file = Path(
         resource_path(
-            "session.json"
+            session_file
         )
     )
     if os.path.isfile(output_file):
@@ -66,10 +66,10 @@ def load_session(user_agent):
     return session_data
 
 
-def update_session(session_data):
+def update_session(session_data, session_file="session.json"):
     output_file = Path(
         resource_path(
-            "session.json"
+            session_file
         )
     )
     session_result = json.dumps(session_data, indent=4)
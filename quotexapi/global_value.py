@@ -1,11 +1,28 @@
 # python
 SSID = None
 check_websocket_if_connect = None
-ssl_Mutual_exclusion = False
-ssl_Mutual_exclusion_write = False
 started_listen_instruments = True
 check_rejected_connection = False
 check_accepted_connection = False
 check_websocket_if_error = False
 websocket_error_reason = None
 balance_id = None
+
+
+class SessionState(object):
+    """Class for the connection state of one account.
+
+    Every :class:`QuotexAPI <quotexapi.api.QuotexAPI>` owns its own state,
+    so many accounts can run in one process. The module values above are
+    only the initial values.
+    """
+
+    def __init__(self):
+        self.SSID = SSID
+        self.check_websocket_if_connect = check_websocket_if_connect
+        self.started_listen_instruments = started_listen_instruments
+        self.check_rejected_connection = check_rejected_connection
+        self.check_accepted_connection = check_accepted_connection
+        self.check_websocket_if_error = check_websocket_if_error
+        self.websocket_error_reason = websocket_error_reason
+        self.balance_id = balance_id
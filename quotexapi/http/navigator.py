@@ -11,7 +11,7 @@ retry_strategy = Retry(
     status_forcelist=[429, 500, 502, 503, 504, 104],
     allowed_methods=["HEAD", "POST", "PUT", "GET", "OPTIONS"]
 )
-adapter = HTTPAdapter(max_retries=retry_strategy)
+adapter = HTTPAdapter(max_retries=retry_strategy, pool_maxsize=100)
 user_agent_list = agents.split("\n")
 
 
@@ -0,0 +1,186 @@
+"""Module for sharing one quote stream between many Quotex clients."""
+import asyncio
+import logging
+import threading
+from collections import deque
+
+logger = logging.getLogger(__name__)
+
+
+class TickQueue(object):
+    """Class for a bounded tick queue, filled from any thread.
+
+    Ticks are appended to a `deque`, whose `extend`/`popleft` are atomic,
+    so the producer never takes a lock; the consumer loop is woken only
+    when it is waiting. When full, the oldest ticks are dropped.
+    """
+
+    def __init__(self, loop, maxlen=10000):
+        self.loop = loop
+        self.ticks = deque(maxlen=maxlen)
+        self.event = asyncio.Event()
+        self.dropped = 0
+
+    def put_many(self, ticks):
+        overflow = len(self.ticks) + len(ticks) - self.ticks.maxlen
+        if overflow > 0:
+            self.dropped += overflow
+        self.ticks.extend(ticks)
+        if not self.event.is_set():
+            self.loop.call_soon_threadsafe(self.event.set)
+
+
+class MarketDataHub(object):
+    """Class for fanning out the quotes of one connection to many clients.
+
+    The `owner` connection is the only one subscribing to quotes and
+    parsing them. Attached clients route their quote subscriptions to the
+    owner, as references counted by the owner's :class:`SubscriptionManager
+    <quotexapi.ws.subscriptions.SubscriptionManager>`, and share its tick
+    buffers and candle aggregators. The `history/list/v2` snapshots
+    received by the owner are forwarded to the attached clients, so
+    :meth:`get_candles <quotexapi.stable_api.Quotex.get_candles>`,
+    :meth:`get_realtime_price <quotexapi.stable_api.Quotex.get_realtime_price>`
+    and :meth:`start_candle_aggregator
+    <quotexapi.stable_api.Quotex.start_candle_aggregator>` work unchanged.
+    Ticks can also be consumed as they arrive with :meth:`stream`.
+
+    Usage::
+
+        hub = MarketDataHub(pool["market@mail.com"])
+        for client in pool:
+            hub.attach(client)
+        hub.subscribe("EURUSD_otc")
+        async for asset, timestamp, price in hub.stream("EURUSD_otc"):
+            ...
+    """
+
+    def __init__(self, owner, queue_size=10000):
+        """
+        :param owner: The instance of :class:`Quotex
+            <quotexapi.stable_api.Quotex>` owning the quote subscriptions.
+        :param int queue_size: The default number of ticks buffered per stream.
+        """
+        self.owner = owner
+        self.queue_size = queue_size
+        self.realtime_price = {}
+        self.candle_aggregators = {}
+        self.clients = []
+        self._streams = {}
+        self._held = {}
+        self._lock = threading.Lock()
+        owner.router.register("quotes/stream", self.on_quotes)
+        owner.router.register("history/list/v2", self.on_history)
+        self.attach(owner)
+
+    def attach(self, client):
+        """Serve the quotes of `client` from the hub, also after reconnects."""
+        if client not in self.clients:
+            self.clients.append(client)
+        client.market_data = self
+        if client.api is not None:
+            self.bind(client.api)
+
+    def detach(self, client):
+        if client is self.owner:
+            raise ValueError("The hub owner can not be detached")
+        if client in self.clients:
+            self.clients.remove(client)
+        client.market_data = None
+        if client.api is not None:
+            for asset in {asset for asset, _ in self._held.get(self._holder(client.api), ())}:
+                self.release(client.api, asset)
+            client.api.market_data = None
+            client.api.realtime_price = {}
+            client.api.candle_aggregators = {}
+
+    def bind(self, api):
+        """Share the hub buffers with a :class:`QuotexAPI <quotexapi.api.QuotexAPI>`."""
+        api.realtime_price = self.realtime_price
+        api.candle_aggregators = self.candle_aggregators
+        api.market_data = None if api is self.owner.api else self
+
+    def subscribe(self, asset, period=0):
+        """Subscribe the owner to the quotes of `asset`, once."""
+        self.owner.subscriptions.hold(asset, period)
+
+    @staticmethod
+    def _holder(api):
+        return api.subscriptions if api.subscriptions is not None else api
+
+    def acquire(self, api, asset, period=0):
+        """Reference a stream of an attached client on the owner.
+
+        Called when the client subscribes `(asset, period)`; a stream the
+        client already references is only asked again for its snapshot.
+        """
+        key = (asset, period)
+        held = self._held.setdefault(self._holder(api), set())
+        if key not in held:
+            held.add(key)
+            self.owner.subscriptions.acquire(asset, period, refresh=True)
+        elif self.owner.api is not None:
+            self.owner.api.subscribe_realtime_candle(asset, period)
+
+    def release(self, api, asset):
+        """Release the owner references taken by an attached client for `asset`."""
+        held = self._held.get(self._holder(api), set())
+        for key in [key for key in held if key[0] == asset]:
+            held.discard(key)
+            self.owner.subscriptions.release(*key)
+
+    def on_history(self, event, message):
+        """Forward a candle snapshot of the owner to the attached clients."""
+        asset = message.get("asset") if isinstance(message, dict) else None
+        if asset is None:
+            return
+        for client in list(self.clients):
+            api = client.api
+            if client is self.owner or api is None or api.market_data is not self:
+                continue
+            if asset == api.current_asset:
+                api.candles.candles_data = message["history"]
+            api.candle_v2_data[asset] = message
+            api.pending.resolve(("candles", asset), message)
+
+    def on_quotes(self, event, message):
+        if not self._streams or not message or len(message[0]) != 4:
+            return
+        with self._lock:
+            streams = list(self._streams.items())
+        for asset, queues in streams:
+            if asset is None:
+                ticks = [(tick[0], tick[1], tick[2]) for tick in message]
+            else:
+                ticks = [(tick[0], tick[1], tick[2]) for tick in message if tick[0] == asset]
+            if ticks:
+                for queue in queues:
+                    queue.put_many(ticks)
+
+    async def stream(self, asset=None, maxlen=None):
+        """Iterate over `(asset, time, price)` ticks as they arrive.
+
+        Each consumer gets its own queue; a slow consumer loses its oldest
+        ticks, see `TickQueue.dropped`, without slowing down the others.
+
+        :param str asset: (optional) The asset, default every asset.
+        :param int maxlen: (optional) The queue size, default `queue_size`.
+        """
+        if asset is not None:
+            self.subscribe(asset)
+        queue = TickQueue(asyncio.get_running_loop(), maxlen or self.queue_size)
+        with self._lock:
+            self._streams.setdefault(asset, []).append(queue)
+        try:
+            while True:
+                queue.event.clear()
+                while queue.ticks:
+                    yield queue.ticks.popleft()
+                await queue.event.wait()
+        finally:
+            with self._lock:
+                queues = self._streams.get(asset, [])
+                if queue in queues:
+                    queues.remove(queue)
+                if not queues:
+                    self._streams.pop(asset, None)
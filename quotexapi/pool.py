@@ -0,0 +1,109 @@
+"""Module for many Quotex accounts in one process."""
+import asyncio
+import logging
+from pathlib import Path
+from .stable_api import Quotex
+from .ws.transport import TRANSPORT_ASYNCIO
+
+logger = logging.getLogger(__name__)
+
+
+class SessionPool(object):
+    """Class for a pool of Quotex accounts sharing one event loop.
+
+    Every account is a :class:`Quotex <quotexapi.stable_api.Quotex>` with
+    its own connection state, session file and websocket. The websockets
+    run on the event loop with the asyncio transport, and the HTTP
+    requests share the connection pool of :mod:`quotexapi.http.navigator`.
+
+    Usage::
+
+        pool = SessionPool()
+        pool.add("a@mail.com", "password")
+        pool.add("b@mail.com", "password")
+        results = await pool.connect_all()
+        balances = await pool.run(lambda client: client.get_balance())
+    """
+
+    def __init__(self, sessions_dir="sessions", transport=TRANSPORT_ASYNCIO, max_connecting=5):
+        """
+        :param sessions_dir: The folder of the per-account session files.
+        :param str transport: The websocket transport of every account.
+        :param int max_connecting: The number of accounts logging in at once.
+        """
+        self.sessions_dir = Path(sessions_dir)
+        self.transport = transport
+        self.max_connecting = max_connecting
+        self.clients = {}
+
+    def __len__(self):
+        return len(self.clients)
+
+    def __iter__(self):
+        return iter(self.clients.values())
+
+    def __getitem__(self, name):
+        return self.clients[name]
+
+    def add(self, email, password, name=None, **kwargs):
+        """Add an account to the pool.
+
+        :param str email: The account e-mail.
+        :param str password: The account password.
+        :param str name: (optional) The key of the account, default `email`.
+        :param kwargs: Other :class:`Quotex <quotexapi.stable_api.Quotex>`
+            arguments, `session_file` defaults to `<sessions_dir>/<name>.json`.
+        :returns: The instance of :class:`Quotex <quotexapi.stable_api.Quotex>`.
+        """
+        name = name or email
+        if name in self.clients:
+            raise ValueError(f"Account already in the pool: {name}")
+        kwargs.setdefault("session_file", self.sessions_dir / f"{name}.json")
+        client = Quotex(email, password, **kwargs)
+        self.clients[name] = client
+        return client
+
+    def remove(self, name):
+        client = self.clients.pop(name)
+        if client.api is not None:
+            client.close()
+        return client
+
+    async def connect_all(self):
+        """Connect every account, at most `max_connecting` at once.
+
+        :returns: The dict of account name to `(check, reason)`.
+        """
+        semaphore = asyncio.Semaphore(self.max_connecting)
+
+        async def connect(name, client):
+            async with semaphore:
+                try:
+                    return await client.connect(self.transport)
+                except Exception as error:
+                    logger.error(f"Account {name} failed to connect: {error}")
+                    return False, str(error)
+
+        results = await asyncio.gather(
+            *[connect(name, client) for name, client in self.clients.items()]
+        )
+        return dict(zip(self.clients, results))
+
+    async def run(self, function):
+        """Run `function(client)` on every connected account concurrently.
+
+        :param function: The coroutine function taking a :class:`Quotex
+            <quotexapi.stable_api.Quotex>`.
+        :returns: The dict of account name to result or raised exception.
+        """
+        clients = {name: client for name, client in self.clients.items() if client.check_connect()}
+        results = await asyncio.gather(
+            *[function(client) for client in clients.values()],
+            return_exceptions=True
+        )
+        return dict(zip(clients, results))
+
+    def close_all(self):
+        for client in self.clients.values():
+            if client.api is not None:
+                client.close()
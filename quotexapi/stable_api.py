@@ -1,16 +1,27 @@
 import time
 import logging
 import asyncio
+from pathlib import Path
+from contextlib import suppress
+from functools import partial
 from datetime import datetime
 from . import expiration
-from . import global_value
 from .api import QuotexAPI
 from .constants import codes_asset
 from .utils.services import truncate
+from .utils.aggregator import CandleAggregator
+from .utils.candle_store import CandleStore
+from .ws.router import MessageRouter
+from .ws.subscriptions import SubscriptionManager
+from .ws.supervisor import ReconnectSupervisor
+from .ws.standby import WarmStandby
+from .ws.capture import FrameRecorder
+from .ws.objects.ticks import EMPTY_VIEW
 from .utils.processor import (
     calculate_candles,
     process_candles_v2,
-    merge_candles
+    merge_candles,
+    normalize_candles
 )
 from .config import (
     load_session,
@@ -22,6 +33,15 @@ __version__ = "1.0.0"
 logger = logging.getLogger(__name__)
 
 
+class CandlesWindowError(Exception):
+    """Raised when a `history/load` window gets no reply after its retries."""
+
+    def __init__(self, asset, end_from_time, offset):
+        super().__init__(f"No history reply for {asset} window ending at {end_from_time} ({offset}s)")
+        self.asset = asset
+        self.end_from_time = end_from_time
+        self.offset = offset
+
 class Quotex(object):
 
     def __init__(
@@ -34,7 +54,8 @@ class Quotex(object):
             root_path=".",
             user_data_dir="browser",
             asset_default="EURUSD",
-            period_default=60
+            period_default=60,
+            session_file="session.json"
     ):
         self.size = [
             1,
@@ -61,18 +82,29 @@ class Quotex(object):
         self.user_data_dir = user_data_dir
         self.asset_default = asset_default
         self.period_default = period_default
-        self.subscribe_candle = []
-        self.subscribe_candle_all_size = []
-        self.subscribe_mood = []
         self.account_is_demo = 1
         self.suspend = 0.5
+        self.request_timeout = 10
+        self.fast_orders = False
+        self.candle_store = None
+        self.market_data = None
         self.api = None
         self.duration = None
         self.websocket_client = None
         self.websocket_thread = None
         self.debug_ws_enable = False
+        self.realtime_price_capacity = 10000
+        self.json_backend = None
+        self.compression = True
+        self.tick_interval = 5.0
+        self.tick_jitter = 0.5
+        self.transport = "thread"
+        self.router = MessageRouter()
+        self.subscriptions = SubscriptionManager()
+        self.supervisor = None
         self.resource_path = resource_path(root_path)
-        session = load_session(user_agent)
+        self.session_file = session_file
+        session = load_session(user_agent, session_file)
         self.session_data = session
 
     @property
@@ -82,9 +114,8 @@ class Quotex(object):
         """
         return self.websocket_client.wss
 
-    @staticmethod
-    def check_connect():
-        if global_value.check_accepted_connection == 1:
+    def check_connect(self):
+        if self.api is not None and self.api.state.check_accepted_connection == 1:
             return True
         else:
             return False
@@ -95,34 +126,98 @@ class Quotex(object):
             "token": ssid,
             "user_agent": user_agent
         }
-        self.session_data = update_session(session)
+        self.session_data = update_session(session, self.session_file)
 
     async def re_subscribe_stream(self):
-        try:
-            for ac in self.subscribe_candle:
-                sp = ac.split(",")
-                await self.start_candles_one_stream(sp[0], sp[1])
-        except:
-            pass
-        try:
-            for ac in self.subscribe_candle_all_size:
-                await self.start_candles_all_size_stream(ac)
-        except:
-            pass
-        try:
-            for ac in self.subscribe_mood:
-                await self.start_mood_stream(ac)
-        except:
-            pass
+        """Subscribe the active streams again on the current connection."""
+        self.subscriptions.replay()
+
+    def start_auto_reconnect(self, base_delay=1.0, max_delay=60.0, max_attempts=None):
+        """Reconnect automatically whenever the websocket drops.
+
+        See :class:`ReconnectSupervisor <quotexapi.ws.supervisor.ReconnectSupervisor>`,
+        its `stats()` report the time to data after each disconnect.
+
+        :returns: The instance of :class:`ReconnectSupervisor
+            <quotexapi.ws.supervisor.ReconnectSupervisor>`.
+        """
+        self.stop_auto_reconnect()
+        self.supervisor = ReconnectSupervisor(
+            self,
+            base_delay=base_delay,
+            max_delay=max_delay,
+            max_attempts=max_attempts
+        )
+        self.supervisor.start()
+        return self.supervisor
+
+    def stop_auto_reconnect(self):
+        if self.supervisor is not None:
+            self.supervisor.stop()
+            self.supervisor = None
+
+    def start_standby(self, buffer_size=256, window_size=4096, switchover=2.0):
+        """Keep a warm standby websocket, promoted when the active one drops.
+
+        Call after :meth:`connect`. See :class:`WarmStandby
+        <quotexapi.ws.standby.WarmStandby>`; a failover does not wake the
+        reconnect supervisor, which only runs when no standby is ready.
+
+        :returns: The instance of :class:`WarmStandby <quotexapi.ws.standby.WarmStandby>`.
+        """
+        self.stop_standby()
+        self.api.standby = WarmStandby(
+            self.api,
+            buffer_size=buffer_size,
+            window_size=window_size,
+            switchover=switchover
+        )
+        self.api.standby.start()
+        return self.api.standby
+
+    def stop_standby(self):
+        if self.api is not None and self.api.standby is not None:
+            self.api.standby.stop()
+            self.api.standby = None
+
+    def start_capture(self, path):
+        """Record every websocket frame sent and received to a capture file.
+
+        Call after :meth:`connect`, the file is replayed offline with
+        :class:`FrameReplayer <quotexapi.ws.capture.FrameReplayer>`.
+
+        :param str path: The capture file, appended to if it exists.
+        :returns: The instance of :class:`FrameRecorder <quotexapi.ws.capture.FrameRecorder>`.
+        """
+        self.stop_capture()
+        self.api.frame_recorder = FrameRecorder(path)
+        return self.api.frame_recorder
+
+    def stop_capture(self):
+        if self.api is not None and self.api.frame_recorder is not None:
+            recorder = self.api.frame_recorder
+            self.api.frame_recorder = None
+            recorder.close()
 
     async def get_instruments(self):
-        while self.check_connect and self.api.instruments is None:
-            await asyncio.sleep(0.5)
+        await self.api.pending.wait_for_state(
+            "instruments",
+            lambda: self.api.instruments
+        )
         return self.api.instruments or []
 
     def get_all_asset_name(self):
         if self.api.instruments:
-            return [[i[1], i[2].replace("\n", "")] for i in self.api.instruments]
+            return [[i.symbol, i.name] for i in self.api.instrument_catalogue]
+
+    async def get_instrument(self, asset_name: str):
+        """Get an asset by symbol, asset id or display name.
+
+        :returns: The instance of :class:`Instrument
+            <quotexapi.ws.objects.instruments.Instrument>` or None.
+        """
+        await self.get_instruments()
+        return self.api.instrument_catalogue.get(asset_name)
 
     async def get_available_asset(self, asset_name: str, force_open: bool = False):
         asset_open = await self.check_asset_open(asset_name)
@@ -134,24 +229,32 @@ class Quotex(object):
         return asset_name, asset_open
 
     async def check_asset_open(self, asset_name: str):
-        instruments = await self.get_instruments()
-        for i in instruments:
-            if asset_name == i[1]:
-                self.api.current_asset = asset_name
-                return i[0], i[2].replace("\n", ""), i[14]
+        await self.get_instruments()
+        instrument = self.api.instrument_catalogue.by_symbol.get(asset_name)
+        if instrument is not None:
+            self.api.current_asset = asset_name
+            return instrument.id, instrument.name, instrument.is_open
 
     async def get_candles(self, asset, end_from_time, offset, period):
         if end_from_time is None:
             end_from_time = time.time()
+        if self.candle_store is not None:
+            return await self.get_candles_range(asset, end_from_time - offset, end_from_time, period)
         index = expiration.get_timestamp()
-        self.api.candles.candles_data = None
-        self.start_candles_stream(asset, period)
-        while True:
-            self.api.get_candles(asset, index, end_from_time, offset, period)
-            while self.check_connect and self.api.candles.candles_data is None:
-                await asyncio.sleep(0.5)
-            if self.api.candles.candles_data is not None:
-                break
+        self.api.candle_v2_data[asset] = None
+        self.api.current_asset = asset
+        with self.subscriptions.fetch(asset, period, refresh=True):
+            while True:
+                self.api.get_candles(asset, index, end_from_time, offset, period)
+                try:
+                    await self.api.pending.wait_for_state(
+                        ("candles", asset),
+                        lambda: self.api.candle_v2_data.get(asset),
+                        self.request_timeout
+                    )
+                    break
+                except asyncio.TimeoutError:
+                    logger.debug(f"get_candles {asset} timed out, sending again.")
 
         candles = self.prepare_candles(asset, period)
         if not isinstance(candles, list):
@@ -159,26 +262,149 @@ class Quotex(object):
 
         return candles
 
+    async def fetch_candles_window(self, asset, end_from_time, offset, period, retries=3):
+        """Load one `history/load` window, correlated by its request index.
+
+        :returns: The list of candles with `end_from_time - offset < time <= end_from_time`.
+        :raises CandlesWindowError: If every retry timed out.
+        """
+        for _ in range(retries):
+            index = self.api.next_request_id()
+            key = ("history", index)
+            future = self.api.pending.expect(key)
+            self.api.get_candles(asset, index, end_from_time, offset, period)
+            try:
+                message = await self.api.pending.wait(key, future, self.request_timeout)
+            except asyncio.TimeoutError:
+                logger.debug(f"History window {asset} {end_from_time} timed out, sending again.")
+                continue
+            return normalize_candles(message.get("data", []), period)
+        raise CandlesWindowError(asset, end_from_time, offset)
+
+    async def iter_candles_range(self, asset, start, end, period, window=3600, concurrency=4):
+        """Stream the candles of `asset` between `start` and `end`.
+
+        The range is split in windows of `window` seconds and up to
+        `concurrency` `history/load` requests are kept in flight. Candles
+        are yielded in time order, without duplicates at window boundaries.
+        With :meth:`enable_candle_cache`, cached ranges are read from disk
+        and only the missing ones are downloaded; a window is stored, and
+        marked as covered, only once its reply has arrived.
+
+        :param str asset: The asset name.
+        :param int start: The timestamp of the first candle.
+        :param int end: The timestamp after the last candle.
+        :param int period: The candle period in seconds.
+        :param int window: The seconds requested per `history/load`.
+        :param int concurrency: The number of requests in flight.
+        :raises CandlesWindowError: If a window gets no reply, the stream
+            stops there instead of skipping it.
+        """
+        start = int(start) - int(start) % period
+        end = int(end)
+        self.api.current_asset = asset
+        with self.subscriptions.fetch(asset, period):
+            if self.candle_store is None:
+                async for candle in self._download_candles_range(asset, start, end, period, window, concurrency):
+                    yield candle
+                return
+            cursor = start
+            for gap_start, gap_end in self.candle_store.missing_ranges(asset, period, start, end) + [(end, end)]:
+                for candle in self.candle_store.load(asset, period, cursor, gap_start):
+                    yield candle
+                if gap_start == gap_end:
+                    continue
+                async for candle in self._download_candles_range(
+                        asset, gap_start, gap_end, period, window, concurrency,
+                        on_window=partial(self.candle_store.save, asset, period)
+                ):
+                    yield candle
+                cursor = gap_end
+
+    async def _download_candles_range(self, asset, start, end, period, window, concurrency, on_window=None):
+        """Download `[start, end)` window by window.
+
+        :param on_window: (optional) Called as `on_window(candles, window_start,
+            window_end)` for every window that got a reply, before its
+            candles are yielded.
+        """
+        window = max(period, window - window % period)
+        windows = list(range(start + window, end + window, window))
+        tasks = {}
+        last_time = None
+        try:
+            for position, window_end in enumerate(windows):
+                for ahead in windows[position:position + concurrency]:
+                    if ahead not in tasks:
+                        tasks[ahead] = asyncio.create_task(
+                            self.fetch_candles_window(asset, ahead, window, period)
+                        )
+                candles = await tasks.pop(window_end)
+                if on_window is not None:
+                    on_window(candles, max(start, window_end - window), min(end, window_end))
+                for candle in sorted(candles, key=lambda x: x["time"]):
+                    if candle["time"] < start or candle["time"] >= end:
+                        continue
+                    if last_time is not None and candle["time"] <= last_time:
+                        continue
+                    last_time = candle["time"]
+                    yield candle
+        finally:
+            for task in tasks.values():
+                task.cancel()
+
+    def enable_candle_cache(self, path="candles.sqlite3"):
+        """Keep closed candles on disk and fetch only missing ranges.
+
+        :param path: The SQLite file, relative paths go under `root_path`.
+        :returns: The instance of :class:`CandleStore
+            <quotexapi.utils.candle_store.CandleStore>`.
+        """
+        path = Path(path)
+        if not path.is_absolute():
+            path = Path(self.resource_path) / path
+        self.candle_store = CandleStore(path)
+        return self.candle_store
+
+    async def get_candles_range(self, asset, start, end, period, window=3600, concurrency=4):
+        """Get the candles of `asset` between `start` and `end` as a list.
+
+        See :meth:`iter_candles_range`.
+        """
+        return [
+            candle async for candle in self.iter_candles_range(
+                asset, start, end, period, window, concurrency
+            )
+        ]
+
     async def get_history_line(self, asset, end_from_time, offset):
         if end_from_time is None:
             end_from_time = time.time()
         index = expiration.get_timestamp()
         self.api.current_asset = asset
         self.api.historical_candles = None
-        self.start_candles_stream(asset)
-        while True:
-            self.api.get_history_line(codes_asset[asset], index, end_from_time, offset)
-            while self.check_connect and self.api.historical_candles is None:
-                await asyncio.sleep(0.5)
-            if self.api.historical_candles is not None:
-                break
+        with self.subscriptions.fetch(asset):
+            while True:
+                self.api.get_history_line(codes_asset[asset], index, end_from_time, offset)
+                try:
+                    await self.api.pending.wait_for_state(
+                        "history",
+                        lambda: self.api.historical_candles,
+                        self.request_timeout
+                    )
+                    break
+                except asyncio.TimeoutError:
+                    logger.debug(f"get_history_line {asset} timed out, sending again.")
         return self.api.historical_candles
 
     async def get_candle_v2(self, asset, period):
         self.api.candle_v2_data[asset] = None
-        self.start_candles_stream(asset, period)
-        while self.api.candle_v2_data[asset] is None:
-            await asyncio.sleep(0.5)
+        self.api.current_asset = asset
+        with self.subscriptions.fetch(asset, period, refresh=True):
+            await self.api.pending.wait_for_state(
+                ("candles", asset),
+                lambda: self.api.candle_v2_data[asset]
+            )
         candles = self.prepare_candles(asset, period)
         return candles
 
@@ -193,13 +419,24 @@ class Quotex(object):
         Returns:
             list: List of prepared candles data.
         """
-        candles_data = calculate_candles(self.api.candles.candles_data, period)
+        history = (self.api.candle_v2_data.get(asset) or {}).get("history")
+        if history is None:
+            history = self.api.candles.candles_data
+        candles_data = calculate_candles(history, period)
         candles_v2_data = process_candles_v2(self.api.candle_v2_data, asset, candles_data)
         new_candles = merge_candles(candles_v2_data)
 
         return new_candles
 
-    async def connect(self):
+    async def connect(self, transport=None):
+        """Connect to Quotex websocket.
+
+        :param str transport: (optional) "thread" runs websocket-client in a
+            daemon thread, "asyncio" keeps the whole connection on the running
+            event loop (requires `websockets`). Defaults to the last one used.
+        """
+        if transport is not None:
+            self.transport = transport
         self.api = QuotexAPI(
             "qxbroker.com",
             self.email,
@@ -207,19 +444,37 @@ class Quotex(object):
             self.lang,
             email_pass=self.email_pass,
             resource_path=self.resource_path,
-            user_data_dir=self.user_data_dir
+            user_data_dir=self.user_data_dir,
+            transport=self.transport
         )
         self.api.trace_ws = self.debug_ws_enable
+        self.api.realtime_price_capacity = self.realtime_price_capacity
+        self.api.json_backend = self.json_backend
+        self.api.compression = self.compression
+        self.api.heartbeat.tick_interval = self.tick_interval
+        self.api.heartbeat.jitter = self.tick_jitter
+        self.api.router = self.router
         self.api.session_data = self.session_data
         self.api.current_asset = self.asset_default
         self.api.current_period = self.period_default
-        global_value.SSID = self.session_data.get("token")
+        self.api.session_file = self.session_file
+        self.api.state.SSID = self.session_data.get("token")
+        if self.market_data is not None:
+            self.market_data.bind(self.api)
+        self.api.subscriptions = self.subscriptions
+        # The default stream is only counted here, the replay once connected
+        # subscribes it along with every other referenced stream.
+        self.subscriptions.bind(None)
+        self.subscriptions.hold(self.asset_default, self.period_default)
+        self.subscriptions.bind(self.api)
         check, reason = await self.api.connect(self.account_is_demo)
         if check:
-            if global_value.check_accepted_connection == 0:
+            if self.api.state.check_accepted_connection == 0:
                 check, reason = await self.connect()
                 if not check:
                     check, reason = check, "Acesso negado, sessão não existe!!!"
+            else:
+                self.subscriptions.replay()
         return check, reason
 
     def set_account_mode(self, balance_mode="PRACTICE"):
@@ -239,14 +494,15 @@ class Quotex(object):
 
     async def edit_practice_balance(self, amount=None):
         self.api.training_balance_edit_request = None
+        future = self.api.pending.expect("training_balance")
         self.api.edit_training_balance(amount)
-        while self.api.training_balance_edit_request is None:
-            await asyncio.sleep(0.5)
-        return self.api.training_balance_edit_request
+        return await self.api.pending.wait("training_balance", future)
 
     async def get_balance(self):
-        while self.api.account_balance is None:
-            await asyncio.sleep(0.5)
+        await self.api.pending.wait_for_state(
+            "balance",
+            lambda: self.api.account_balance
+        )
         balance = self.api.account_balance.get("demoBalance") \
             if self.api.account_type > 0 else self.api.account_balance.get("liveBalance")
         return float(f"{truncate(balance + self.get_profit(), 2):.2f}")
@@ -263,47 +519,62 @@ class Quotex(object):
         account_type = "demo" if self.account_is_demo else "live"
         return await self.api.get_trader_history(account_type, page_number=1)
 
-    async def buy(self, amount: float, asset: str, direction: str, duration: int):
-        """Buy Binary option"""
-        request_id = expiration.get_timestamp()
-        self.api.buy_id = None
+    async def buy(self, amount: float, asset: str, direction: str, duration: int, fast: bool = None):
+        """Buy Binary option.
+
+        Safe to run concurrently, e.g. with `asyncio.gather`: every order gets
+        its own `requestId` and waits only for its own confirmation.
+
+        :param fast: (optional) Send the order as a single `orders/open`
+            frame, without subscribing the candles stream; default
+            `self.fast_orders`.
+        :returns: The tuple `(status, info)`, `info` is the `s_orders/open`
+            reply or the error reason.
+        """
+        request_id = self.api.next_request_id()
+        key = ("buy", request_id)
+        self.api.order_latency.start(request_id)
+        fast = self.fast_orders if fast is None else fast
         self.api.timesync.server_timestamp = time.time()
-        self.start_candles_stream(asset, duration)
-        self.api.buy(amount, asset, direction, duration, request_id)
-        count = 0.1
-        while self.api.buy_id is None:
-            count += 0.1
-            if count > duration:
-                status_buy = False
-                break
-            await asyncio.sleep(0.5)
-            if global_value.check_websocket_if_error:
-                return False, global_value.websocket_error_reason
-        else:
-            status_buy = True
-        return status_buy, self.api.buy_successful
+        if not fast:
+            self.start_candles_stream(asset, duration)
+        future = self.api.pending.expect(key)
+        self.api.order_requests.append(request_id)
+        handle = self.api.buy(amount, asset, direction, duration, request_id, fast)
+        try:
+            message = await self.api.pending.wait(key, future, duration)
+        except asyncio.TimeoutError:
+            self.api.order_latency.discard(request_id)
+            return False, None
+        finally:
+            # A caller that stopped waiting must never see the order placed later.
+            handle.cancel()
+            with suppress(ValueError):
+                self.api.order_requests.remove(request_id)
+        self.api.order_latency.finish(request_id)
+        if message.get("error"):
+            return False, message["error"]
+        return True, message
 
     async def sell_option(self, options_ids):
         """Sell asset Quotex"""
-        self.api.sell_option(options_ids)
         self.api.sold_options_respond = None
-        while self.api.sold_options_respond is None:
-            await asyncio.sleep(0.5)
-        return self.api.sold_options_respond
+        future = self.api.pending.expect("sell_option")
+        self.api.sell_option(options_ids)
+        return await self.api.pending.wait("sell_option", future)
 
     def get_payment(self):
         """Payment Quotex server"""
         assets_data = {}
-        for i in self.api.instruments:
-            # print(i)
-            assets_data[i[2].replace("\n", "")] = {
-                "turbo_payment": i[18],
-                "payment": i[5],
+        for i in self.api.instrument_catalogue:
+            assets_data[i.name] = {
+                "turbo_payment": i.turbo_payment,
+                "payment": i.payment,
                 "profit": {
-                    "1M": i[-9],
-                    "5M": i[-8]
+                    "1M": i.profit_1m,
+                    "5M": i.profit_5m
                 },
-                "open": i[14]
+                "open": i.is_open
             }
         return assets_data
 
@@ -317,58 +588,189 @@ class Quotex(object):
             await asyncio.sleep(1)
         await asyncio.sleep(5)
 
-    async def check_win(self, id_number):
-        """Check win based id"""
-        await self.start_remaing_time()
-        while True:
-            try:
-                listinfodata_dict = self.api.listinfodata.get(id_number)
-                if listinfodata_dict["game_state"] == 1:
-                    break
-            except:
-                pass
-        self.api.listinfodata.delete(id_number)
-        return listinfodata_dict["win"]
+    async def check_win(self, id_number, timeout=None):
+        """Check win based id.
+
+        Waits without blocking the event loop until the deal is closed.
 
-    def start_candles_stream(self, asset, period=0):
+        :param timeout: (optional) Seconds to wait.
+        :returns: True if the deal was won, None on timeout.
+        """
+        result = await self.wait_for_result(id_number, timeout)
+        if result is None:
+            return None
+        self.api.listinfodata.pop(id_number)
+        return result["win"]
+
+    async def wait_for_result(self, id_number, timeout=None):
+        """Wait until a deal is closed.
+
+        :param id_number: The deal id, as returned by :meth:`buy`.
+        :param timeout: (optional) Seconds to wait.
+        :returns: The dict with `win`, `game_state` and `profit`, or None on timeout.
+        """
+        results = await self.wait_for_results([id_number], timeout)
+        return results[id_number]
+
+    async def wait_for_results(self, ids, timeout=None):
+        """Wait until many deals are closed, with one future per deal.
+
+        :param ids: The deal ids.
+        :param timeout: (optional) Seconds to wait for all of them.
+        :returns: The dict of deal id to result, None for the deals still
+            open at the timeout.
+        """
+        listinfodata = self.api.listinfodata
+        results = {}
+        futures = {}
+        for id_number in ids:
+            futures[id_number] = self.api.pending.expect(("deal", id_number))
+            results[id_number] = listinfodata.settled(id_number)
+        waiting = [futures[id_number] for id_number, result in results.items() if result is None]
+        try:
+            if waiting:
+                await asyncio.wait(waiting, timeout=timeout)
+        finally:
+            for id_number, future in futures.items():
+                self.api.pending.discard(("deal", id_number), future)
+        for id_number in ids:
+            if results[id_number] is None:
+                results[id_number] = listinfodata.settled(id_number)
+        return results
+
+    def start_candles_stream(self, asset, period=0, refresh=False):
+        """Keep the quotes of `asset` streaming, subscribed only once.
+
+        :param bool refresh: (optional) Ask again for the `history/list/v2`
+            snapshot if the stream is already subscribed.
+        """
         self.api.current_asset = asset
-        self.api.subscribe_realtime_candle(asset, period)
-        self.api.follow_candle(asset)
+        self.subscriptions.hold(asset, period, refresh)
 
     def stop_candles_stream(self, asset):
-        self.api.unsubscribe_realtime_candle(asset)
-        self.api.unfollow_candle(asset)
+        """Release the streams of `asset` started by :meth:`start_candles_stream`.
+
+        The asset is unsubscribed once no request uses it anymore.
+        """
+        self.subscriptions.drop(asset)
 
     def start_signals_data(self):
         self.api.signals_subscribe()
 
     async def get_realtime_candles(self, asset: str, period: int = 0):
-        self.start_candles_stream(asset, period)
-        while True:
-            if self.api.candle_v2_data.get(asset):
-                candles = self.prepare_candles(asset, period)
-                for candle in candles:
-                    self.api.real_time_candles[candle["time"]] = candle
-                return self.api.real_time_candles
-            await asyncio.sleep(0.5)
+        aggregator = self.api.candle_aggregators.get(asset)
+        seed = aggregator is None or period not in aggregator.periods
+        self.start_candles_stream(asset, period, refresh=seed)
+        if seed:
+            await self.api.pending.wait_for_state(
+                ("candles", asset),
+                lambda: self.api.candle_v2_data.get(asset)
+            )
+            aggregator = self.start_candle_aggregator(asset, (period,))
+            aggregator.seed(period, self.prepare_candles(asset, period))
+        for candle in aggregator.candles(period):
+            self.api.real_time_candles[candle["time"]] = candle
+        return self.api.real_time_candles
+
+    def start_candle_aggregator(self, asset: str, periods=(5, 15, 60, 300), callback=None):
+        """Build OHLC candles of `asset` incrementally from the quote stream.
+
+        :param str asset: The asset name.
+        :param periods: The candle periods in seconds, aggregated together.
+        :param callback: (optional) Called as `callback(asset, period, candle)`
+            whenever a candle closes.
+        :returns: The instance of :class:`CandleAggregator
+            <quotexapi.utils.aggregator.CandleAggregator>`, also usable as
+            `async for period, candle in aggregator.stream()`.
+        """
+        aggregator = self.api.candle_aggregators.get(asset)
+        if aggregator is None:
+            aggregator = CandleAggregator(asset, periods)
+            self.api.candle_aggregators[asset] = aggregator
+        else:
+            for period in periods:
+                aggregator.add_period(period)
+        if callback:
+            aggregator.add_callback(callback)
+        self.start_candles_stream(asset, min(periods))
+        return aggregator
+
+    def stop_candle_aggregator(self, asset: str):
+        self.api.candle_aggregators.pop(asset, None)
 
     async def start_realtime_price(self,  asset: str, period: int = 0):
-        self.api.subscribe_realtime_candle(asset, period)
-        self.api.follow_candle(asset)
+        self.subscriptions.hold(asset, period)
+
+    async def get_realtime_price(self, asset: str, count: int = None):
+        """Get the latest ticks of an asset, oldest first.
 
-    async def get_realtime_price(self, asset: str):
-        return self.api.realtime_price.get(asset, {})
+        :param str asset: The asset name.
+        :param int count: (optional) The number of latest ticks, default all
+            kept (`realtime_price_capacity`).
+        :returns: The instance of :class:`TickView
+            <quotexapi.ws.objects.ticks.TickView>`, a zero-copy window that
+            iterates as `{"time", "price"}` dicts.
+        """
+        prices = self.api.realtime_price.get(asset)
+        if prices is None:
+            return EMPTY_VIEW
+        return prices.view(count)
 
     async def start_realtime_sentiment(self, asset: str, period: int = 0):
         self.start_candles_stream(asset, period)
-        while True:
-            if self.api.realtime_sentiment.get(asset):
-                return self.api.realtime_sentiment[asset]
-            await asyncio.sleep(0.5)
+        return await self.api.pending.wait_for_state(
+            ("sentiment", asset),
+            lambda: self.api.realtime_sentiment.get(asset)
+        )
 
     async def get_realtime_sentiment(self, asset: str):
         return self.api.realtime_sentiment.get(asset, {})
 
+    def add_event_handler(self, event: str, handler):
+        """Call `handler(event, message)` for every `event` frame received.
+
+        Use "*" to receive every event. Handlers run on the websocket
+        receive path, so they should return quickly.
+        """
+        self.router.register(event, handler)
+
+    def remove_event_handler(self, event: str, handler):
+        self.router.unregister(event, handler)
+
+    def get_send_queue_stats(self):
+        """Get outbound queue depth, drops and send latency."""
+        return self.api.send_queue.stats()
+
+    def get_order_latency_stats(self, output="dict"):
+        """Get the order latency histograms, per lifecycle stage.
+
+        Stages are `serialize`, `enqueue`, `send`, `first_byte`, `parse` and
+        `resolved`, each timed from the previous one, plus `total`.
+
+        :param str output: `dict`, `json` or `prometheus` text.
+        """
+        latency = self.api.order_latency
+        if output == "json":
+            return latency.to_json()
+        if output == "prometheus":
+            return latency.to_prometheus()
+        return latency.stats()
+
+    def get_frame_stats(self, output="dict"):
+        """Get the websocket frame and byte counters, per direction and event.
+
+        `wire_bytes` is smaller than `bytes` when permessage-deflate is
+        active, which needs the asyncio transport and `compression = True`.
+
+        :param str output: `dict`, `json` or `prometheus` text.
+        """
+        counters = self.api.frame_counters
+        if output == "json":
+            return counters.to_json()
+        if output == "prometheus":
+            return counters.to_prometheus()
+        return counters.stats()
+
     def get_signal_data(self):
         return self.api.signal_data
 
@@ -394,60 +796,18 @@ class Quotex(object):
         return None, "OperationID Not Found."
 
     async def start_candles_one_stream(self, asset, size):
-        if not (str(asset + "," + str(size)) in self.subscribe_candle):
-            self.subscribe_candle.append((asset + "," + str(size)))
-        start = time.time()
-        self.api.candle_generated_check[str(asset)][int(size)] = {}
-        while True:
-            if time.time() - start > 20:
-                logger.error(
-                    '**error** start_candles_one_stream late for 20 sec')
-                return False
-            try:
-                if self.api.candle_generated_check[str(asset)][int(size)]:
-                    return True
-            except:
-                pass
-            try:
-                self.api.follow_candle(codes_asset[asset])
-            except:
-                logger.error('**error** start_candles_stream reconnect')
-                await self.connect()
-            await asyncio.sleep(0.5)
+        self.start_candles_stream(asset, int(size))
+        return True
 
     async def start_candles_all_size_stream(self, asset):
-        self.api.candle_generated_all_size_check[str(asset)] = {}
-        if not (str(asset) in self.subscribe_candle_all_size):
-            self.subscribe_candle_all_size.append(str(asset))
-        start = time.time()
-        while True:
-            if time.time() - start > 20:
-                logger.error(f'**error** fail {asset} start_candles_all_size_stream late for 10 sec')
-                return False
-            try:
-                if self.api.candle_generated_all_size_check[str(asset)]:
-                    return True
-            except:
-                pass
-            try:
-                self.api.subscribe_all_size(codes_asset[asset])
-            except:
-                logger.error(
-                    '**error** start_candles_all_size_stream reconnect')
-                await self.connect()
-            await asyncio.sleep(0.5)
+        self.start_candles_stream(asset)
+        return True
 
     async def start_mood_stream(self, asset, instrument="turbo-option"):
-        if asset not in self.subscribe_mood:
-            self.subscribe_mood.append(asset)
-        while True:
-            self.api.subscribe_Traders_mood(
-                asset[asset], instrument)
-            try:
-                self.api.traders_mood[codes_asset[asset]] = codes_asset[asset]
-                break
-            finally:
-                await asyncio.sleep(0.5)
+        self.start_candles_stream(asset)
 
     def close(self):
+        self.stop_auto_reconnect()
+        self.stop_standby()
+        self.stop_capture()
         return self.api.close()
@@ -0,0 +1,130 @@
+import asyncio
+import logging
+import threading
+from collections import deque
+
+logger = logging.getLogger(__name__)
+
+
+class CandleAggregator(object):
+    """Class for incremental OHLC candles built from the quote stream.
+
+    Every tick updates the open candle of each period in O(1). When a tick
+    falls in a later bucket the open candle is closed, kept in a bounded
+    history and emitted to the callbacks and to :meth:`stream` consumers.
+    Candles use the same dict layout as
+    :func:`calculate_candles <quotexapi.utils.processor.calculate_candles>`.
+    """
+
+    def __init__(self, asset, periods=(5, 15, 60, 300), max_closed=1000):
+        """
+        :param str asset: The asset name.
+        :param periods: The candle periods in seconds.
+        :param int max_closed: The number of closed candles kept per period.
+        """
+        self.asset = asset
+        self.max_closed = max_closed
+        self.periods = []
+        self.current = {}
+        self.closed = {}
+        self.callbacks = []
+        self._streams = []
+        self._lock = threading.Lock()
+        for period in periods:
+            self.add_period(period)
+
+    def add_period(self, period):
+        """Start aggregating candles of `period` seconds."""
+        if period <= 0:
+            raise ValueError(f"Invalid candle period: {period}")
+        if period not in self.current:
+            self.periods.append(period)
+            self.current[period] = None
+            self.closed[period] = deque(maxlen=self.max_closed)
+
+    def add_callback(self, callback):
+        """Call `callback(asset, period, candle)` for each closed candle."""
+        self.callbacks.append(callback)
+
+    def remove_callback(self, callback):
+        if callback in self.callbacks:
+            self.callbacks.remove(callback)
+
+    def seed(self, period, candles):
+        """Load closed candles, e.g. from history, before the open candle."""
+        self.add_period(period)
+        current = self.current[period]
+        history = self.closed[period]
+        last_time = history[-1]["time"] if history else None
+        for candle in sorted(candles, key=lambda x: x["time"]):
+            if current and candle["time"] >= current["time"]:
+                break
+            if last_time is None or candle["time"] > last_time:
+                history.append(dict(candle))
+                last_time = candle["time"]
+
+    def update(self, timestamp, price):
+        """Add a tick to the open candle of every period."""
+        for period in self.periods:
+            start = int(timestamp // period) * period
+            candle = self.current[period]
+            if candle is None or start > candle["time"]:
+                self.current[period] = {
+                    "time": start,
+                    "open": price,
+                    "close": price,
+                    "high": price,
+                    "low": price,
+                    "ticks": 1
+                }
+                if candle is not None:
+                    self.closed[period].append(candle)
+                    self._emit(period, candle)
+            elif start == candle["time"]:
+                candle["close"] = price
+                if price > candle["high"]:
+                    candle["high"] = price
+                elif price < candle["low"]:
+                    candle["low"] = price
+                candle["ticks"] += 1
+
+    def candles(self, period, include_current=True):
+        """Get the closed candles of `period`, oldest first.
+
+        :param int period: The candle period in seconds.
+        :param bool include_current: Append the open candle too.
+        """
+        candles = list(self.closed[period])
+        current = self.current[period]
+        if include_current and current is not None:
+            candles.append(dict(current))
+        return candles
+
+    def _emit(self, period, candle):
+        for callback in self.callbacks:
+            try:
+                callback(self.asset, period, candle)
+            except Exception as error:
+                logger.error(f"Candle callback {callback} failed: {error}")
+        with self._lock:
+            streams = list(self._streams)
+        for loop, queue in streams:
+            loop.call_soon_threadsafe(queue.put_nowait, (period, candle))
+
+    async def stream(self):
+        """Iterate over `(period, candle)` as candles close.
+
+        Usage::
+
+            async for period, candle in aggregator.stream():
+                ...
+        """
+        item = (asyncio.get_running_loop(), asyncio.Queue())
+        with self._lock:
+            self._streams.append(item)
+        try:
+            while True:
+                yield await item[1].get()
+        finally:
+            with self._lock:
+                self._streams.remove(item)
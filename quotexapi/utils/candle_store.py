@@ -0,0 +1,136 @@
+import time
+import sqlite3
+from pathlib import Path
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS candles (
+    asset TEXT NOT NULL,
+    period INTEGER NOT NULL,
+    time INTEGER NOT NULL,
+    open REAL NOT NULL,
+    close REAL NOT NULL,
+    high REAL NOT NULL,
+    low REAL NOT NULL,
+    ticks INTEGER NOT NULL,
+    PRIMARY KEY (asset, period, time)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS coverage (
+    asset TEXT NOT NULL,
+    period INTEGER NOT NULL,
+    start INTEGER NOT NULL,
+    end INTEGER NOT NULL,
+    PRIMARY KEY (asset, period, start)
+) WITHOUT ROWID;
+"""
+
+
+class CandleStore(object):
+    """Class for the on-disk cache of closed candles, keyed by (asset, period).
+
+    Only candles that are already closed are stored, so cached rows never
+    change. Besides the candles, the store remembers which time ranges were
+    fetched, so ranges without trading (weekends, closed assets) are not
+    requested again and :meth:`missing_ranges` returns only true gaps.
+    """
+
+    def __init__(self, path="candles.sqlite3"):
+        """
+        :param path: The SQLite database file, created if needed.
+        """
+        if str(path) != ":memory:":
+            Path(path).parent.mkdir(exist_ok=True, parents=True)
+        self.path = path
+        self.connection = sqlite3.connect(str(path))
+        self.connection.executescript(SCHEMA)
+
+    def close(self):
+        self.connection.close()
+
+    @staticmethod
+    def closed_before(period, now=None):
+        """Get the start of the open candle: everything before it is final."""
+        now = int(time.time() if now is None else now)
+        return now - now % period
+
+    def coverage(self, asset, period):
+        """Get the fetched `(start, end)` ranges of an asset, sorted."""
+        return self.connection.execute(
+            "SELECT start, end FROM coverage WHERE asset = ? AND period = ? ORDER BY start",
+            (asset, period)
+        ).fetchall()
+
+    def missing_ranges(self, asset, period, start, end):
+        """Get the sub-ranges of `[start, end)` that are not cached yet.
+
+        :returns: The list of `(start, end)` tuples, in time order.
+        """
+        gaps = []
+        cursor = start
+        for covered_start, covered_end in self.coverage(asset, period):
+            if covered_end <= cursor:
+                continue
+            if covered_start >= end:
+                break
+            if covered_start > cursor:
+                gaps.append((cursor, covered_start))
+            cursor = max(cursor, covered_end)
+        if cursor < end:
+            gaps.append((cursor, end))
+        return gaps
+
+    def load(self, asset, period, start, end):
+        """Get the cached candles with `start <= time < end` as dicts."""
+        rows = self.connection.execute(
+            "SELECT time, open, close, high, low, ticks FROM candles "
+            "WHERE asset = ? AND period = ? AND time >= ? AND time < ? ORDER BY time",
+            (asset, period, start, end)
+        )
+        return [{
+            "time": row[0],
+            "open": row[1],
+            "close": row[2],
+            "high": row[3],
+            "low": row[4],
+            "ticks": row[5]
+        } for row in rows]
+
+    def save(self, asset, period, candles, start, end, now=None):
+        """Store the closed candles fetched for `[start, end)`.
+
+        The part of the range that is not closed yet is neither stored nor
+        marked as covered, it is fetched again next time.
+        """
+        end = min(end, self.closed_before(period, now))
+        if end <= start:
+            return
+        with self.connection:
+            self.connection.executemany(
+                "INSERT OR REPLACE INTO candles VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                [(
+                    asset,
+                    period,
+                    int(candle["time"]),
+                    candle["open"],
+                    candle["close"],
+                    candle["high"],
+                    candle["low"],
+                    candle.get("ticks", 0)
+                ) for candle in candles if start <= candle["time"] < end]
+            )
+            self._cover(asset, period, start, end)
+
+    def _cover(self, asset, period, start, end):
+        merged = []
+        for covered_start, covered_end in sorted(self.coverage(asset, period) + [(start, end)]):
+            if merged and covered_start <= merged[-1][1]:
+                merged[-1][1] = max(merged[-1][1], covered_end)
+            else:
+                merged.append([covered_start, covered_end])
+        self.connection.execute(
+            "DELETE FROM coverage WHERE asset = ? AND period = ?",
+            (asset, period)
+        )
+        self.connection.executemany(
+            "INSERT INTO coverage VALUES (?, ?, ?, ?)",
+            [(asset, period, covered_start, covered_end) for covered_start, covered_end in merged]
+        )
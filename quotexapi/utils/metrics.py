@@ -0,0 +1,321 @@
+import json
+import math
+import time
+import threading
+from collections import OrderedDict
+
+ORDER_STAGES = ("serialize", "enqueue", "send", "first_byte", "parse", "resolved")
+PERCENTILES = (50.0, 90.0, 99.0, 99.9)
+
+
+class Histogram(object):
+    """Class for an HDR-style histogram of durations.
+
+    Values are counted in log-linear buckets of integer `unit`s: exact up
+    to `2 * 10 ** significant_digits` units, then every power of two is
+    split in the same number of sub-buckets, so any recorded value is
+    known within `10 ** -significant_digits` of its magnitude. Recording
+    is O(1) and the memory is fixed by `highest`.
+    """
+
+    def __init__(self, highest=60.0, unit=1e-6, significant_digits=2):
+        """
+        :param float highest: The largest trackable value in seconds,
+            larger values are counted as `highest`.
+        :param float unit: The smallest distinguishable value in seconds.
+        :param int significant_digits: The precision, from 1 to 5.
+        """
+        if not 1 <= significant_digits <= 5:
+            raise ValueError("significant_digits must be between 1 and 5")
+        self.unit = unit
+        self.sub_bucket_bits = math.ceil(math.log2(2 * 10 ** significant_digits))
+        self.sub_bucket_count = 1 << self.sub_bucket_bits
+        self.sub_bucket_half = self.sub_bucket_count >> 1
+        self.highest = max(1, int(highest / unit))
+        self.counts = [0] * (self._index(self.highest) + 1)
+        self.reset()
+
+    def reset(self):
+        for i in range(len(self.counts)):
+            self.counts[i] = 0
+        self.count = 0
+        self.total = 0
+        self.min = None
+        self.max = None
+
+    def _index(self, value):
+        if value < self.sub_bucket_count:
+            return value
+        shift = value.bit_length() - self.sub_bucket_bits
+        return self.sub_bucket_count + (shift - 1) * self.sub_bucket_half + (value >> shift) - self.sub_bucket_half
+
+    def _highest_equivalent(self, index):
+        if index < self.sub_bucket_count:
+            return index
+        shift, offset = divmod(index - self.sub_bucket_count, self.sub_bucket_half)
+        shift += 1
+        return ((offset + self.sub_bucket_half + 1) << shift) - 1
+
+    def record(self, seconds, count=1):
+        """Count a duration in seconds."""
+        value = min(max(0, int(seconds / self.unit)), self.highest)
+        self.counts[self._index(value)] += count
+        self.count += count
+        self.total += value * count
+        if self.min is None or value < self.min:
+            self.min = value
+        if self.max is None or value > self.max:
+            self.max = value
+
+    def merge(self, other):
+        """Add the counts of another histogram with the same layout."""
+        if len(other.counts) != len(self.counts) or other.unit != self.unit:
+            raise ValueError("Histograms have different layouts")
+        for i, count in enumerate(other.counts):
+            self.counts[i] += count
+        self.count += other.count
+        self.total += other.total
+        for value in (other.min, other.max):
+            if value is not None:
+                self.min = value if self.min is None else min(self.min, value)
+                self.max = value if self.max is None else max(self.max, value)
+
+    def percentile(self, percentile):
+        """Get the value in seconds below which `percentile`% of values fall."""
+        if not self.count:
+            return 0.0
+        rank = max(1, math.ceil(percentile / 100.0 * self.count))
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank:
+                value = min(self._highest_equivalent(index), self.max)
+                return value * self.unit
+        return self.max * self.unit
+
+    @property
+    def mean(self):
+        return self.total * self.unit / self.count if self.count else 0.0
+
+    def to_dict(self):
+        """Get count, min, max, mean and percentiles, in seconds."""
+        return {
+            "count": self.count,
+            "min": (self.min or 0) * self.unit,
+            "max": (self.max or 0) * self.unit,
+            "mean": self.mean,
+            "sum": self.total * self.unit,
+            "percentiles": {
+                f"p{percentile:g}": self.percentile(percentile) for percentile in PERCENTILES
+            }
+        }
+
+
+class OrderLatencyTracker(object):
+    """Class for timing the order lifecycle, per stage.
+
+    An order is started when `Quotex.buy` is called and marked at each
+    stage, in :data:`ORDER_STAGES` order. When it finishes, the time spent
+    since the previous mark is recorded in the histogram of each stage,
+    plus the end-to-end `total`. Marks may come from the websocket thread.
+    """
+
+    def __init__(self, max_pending=1000):
+        """
+        :param int max_pending: The number of unfinished orders kept,
+            older ones (e.g. timed out) are forgotten.
+        """
+        self.max_pending = max_pending
+        self.histograms = {
+            stage: Histogram() for stage in ORDER_STAGES + ("total",)
+        }
+        self.orders = OrderedDict()
+        self.frames = {}
+        self._lock = threading.Lock()
+
+    def start(self, request_id):
+        with self._lock:
+            self.orders[request_id] = {"start": time.perf_counter()}
+            while len(self.orders) > self.max_pending:
+                self._forget(next(iter(self.orders)))
+
+    def mark(self, request_id, stage, at=None):
+        """Mark that an order reached `stage`, now or at `at` (perf_counter)."""
+        with self._lock:
+            marks = self.orders.get(request_id)
+            if marks is not None and stage not in marks:
+                marks[stage] = time.perf_counter() if at is None else at
+
+    def track_frame(self, request_id, frame):
+        """Remember the `orders/open` frame of an order, to mark it as sent."""
+        with self._lock:
+            if request_id in self.orders:
+                self.frames[frame] = request_id
+
+    def frame_sent(self, frame, at=None):
+        """Mark the order of `frame` as sent, if it is tracked."""
+        with self._lock:
+            request_id = self.frames.pop(frame, None)
+        if request_id is not None:
+            self.mark(request_id, "send", at)
+
+    def finish(self, request_id):
+        """Record the stages of a resolved order in the histograms."""
+        self.mark(request_id, "resolved")
+        with self._lock:
+            marks = self._forget(request_id)
+        if not marks:
+            return
+        previous = marks["start"]
+        for stage in ORDER_STAGES:
+            if stage in marks:
+                self.histograms[stage].record(marks[stage] - previous)
+                previous = marks[stage]
+        self.histograms["total"].record(previous - marks["start"])
+
+    def discard(self, request_id):
+        """Forget an order that will not finish, e.g. on timeout."""
+        with self._lock:
+            self._forget(request_id)
+
+    def _forget(self, request_id):
+        marks = self.orders.pop(request_id, None)
+        if marks is not None:
+            for frame in [frame for frame, value in self.frames.items() if value == request_id]:
+                del self.frames[frame]
+        return marks
+
+    def reset(self):
+        for histogram in self.histograms.values():
+            histogram.reset()
+
+    def stats(self):
+        """Get the histogram summary of every stage, in seconds."""
+        return {stage: histogram.to_dict() for stage, histogram in self.histograms.items()}
+
+    def to_json(self, **kwargs):
+        return json.dumps(self.stats(), **kwargs)
+
+    def to_prometheus(self, name="quotex_order_latency_seconds"):
+        """Get the stages as a Prometheus text exposition summary."""
+        lines = [
+            f"# HELP {name} Order latency by lifecycle stage.",
+            f"# TYPE {name} summary"
+        ]
+        for stage, histogram in self.histograms.items():
+            for percentile in PERCENTILES:
+                lines.append(
+                    f'{name}{{stage="{stage}",quantile="{percentile / 100:g}"}} '
+                    f'{histogram.percentile(percentile):.9g}'
+                )
+            lines.append(f'{name}_sum{{stage="{stage}"}} {histogram.total * histogram.unit:.9g}')
+            lines.append(f'{name}_count{{stage="{stage}"}} {histogram.count}')
+        return "\n".join(lines) + "\n"
+
+
+FRAME_DIRECTIONS = ("received", "sent")
+CONTROL_EVENT = "-"
+
+
+def frame_event(frame):
+    """Get the Socket.IO event name of a `42["event",...]` frame, or None."""
+    if isinstance(frame, (bytes, bytearray)):
+        frame = bytes(frame[:64]).decode("utf-8", "ignore")
+    if not frame.startswith('42["'):
+        return None
+    end = frame.find('"', 4)
+    return frame[4:end] if end > 0 else None
+
+
+def frame_size(frame):
+    """Get the payload size of a frame in bytes."""
+    if isinstance(frame, str):
+        return len(frame) if frame.isascii() else len(frame.encode())
+    return len(frame)
+
+
+class FrameCounters(object):
+    """Class for counting websocket frames and bytes, per direction and event.
+
+    `bytes` is the payload size and `wire_bytes` the size on the socket,
+    smaller when the frame was compressed with permessage-deflate. Frames
+    without an event (Engine.IO control packets) are counted under
+    :data:`CONTROL_EVENT`. Counts may come from the websocket thread.
+    """
+
+    def __init__(self):
+        self.counters = {direction: {} for direction in FRAME_DIRECTIONS}
+        self._lock = threading.Lock()
+
+    def record(self, direction, event, size, wire_size=None):
+        """Count one frame.
+
+        :param str direction: "received" or "sent".
+        :param str event: The Socket.IO event name, or None.
+        :param int size: The payload size in bytes.
+        :param int wire_size: (optional) The compressed size, default `size`.
+        """
+        event = event or CONTROL_EVENT
+        with self._lock:
+            counter = self.counters[direction].get(event)
+            if counter is None:
+                counter = self.counters[direction][event] = [0, 0, 0]
+            counter[0] += 1
+            counter[1] += size
+            counter[2] += size if wire_size is None else wire_size
+
+    def reset(self):
+        with self._lock:
+            for counters in self.counters.values():
+                counters.clear()
+
+    def stats(self):
+        """Get frames, bytes, wire bytes and compression ratio per direction and event."""
+        with self._lock:
+            return {
+                direction: {
+                    event: {
+                        "frames": frames,
+                        "bytes": size,
+                        "wire_bytes": wire_size,
+                        "ratio": wire_size / size if size else 1.0
+                    }
+                    for event, (frames, size, wire_size) in counters.items()
+                }
+                for direction, counters in self.counters.items()
+            }
+
+    def totals(self):
+        """Get the counters summed over all events, per direction."""
+        totals = {}
+        for direction, events in self.stats().items():
+            frames = sum(item["frames"] for item in events.values())
+            size = sum(item["bytes"] for item in events.values())
+            wire_size = sum(item["wire_bytes"] for item in events.values())
+            totals[direction] = {
+                "frames": frames,
+                "bytes": size,
+                "wire_bytes": wire_size,
+                "ratio": wire_size / size if size else 1.0
+            }
+        return totals
+
+    def to_json(self, **kwargs):
+        return json.dumps(self.stats(), **kwargs)
+
+    def to_prometheus(self, name="quotex_websocket"):
+        """Get the counters as Prometheus text exposition counters."""
+        metrics = (
+            ("frames_total", "Websocket frames", "frames"),
+            ("bytes_total", "Websocket payload bytes", "bytes"),
+            ("wire_bytes_total", "Websocket bytes on the socket, after compression", "wire_bytes"),
+        )
+        stats = self.stats()
+        lines = []
+        for suffix, description, key in metrics:
+            lines.append(f"# HELP {name}_{suffix} {description} by direction and event.")
+            lines.append(f"# TYPE {name}_{suffix} counter")
+            for direction, events in stats.items():
+                for event, item in events.items():
+                    lines.append(f'{name}_{suffix}{{direction="{direction}",event="{event}"}} {item[key]}')
+        return "\n".join(lines) + "\n"
@@ -71,11 +71,17 @@ def process_candles(history, period):
 def process_candles_v2(history, asset, data):
     candles_data = history.get(asset, {})
     candles = candles_data.get("candles", [])[1:]
+    if hasattr(candles, "to_dicts"):
+        candles = candles.to_dicts()
     candles += data
     return candles
 
 
 def calculate_candles(history, period):
+    return candles_from_ticks(history, period)[:-1]
+
+
+def candles_from_ticks(history, period):
     grouped = group_by_period(history, period)
     candles = []
     for minute, ticks in grouped.items():
@@ -93,11 +99,30 @@ def calculate_candles(history, period):
             'ticks': num_ticks
         }
         candles.append(candle)
-    candles = candles[:-1]
 
     return candles
 
 
+def normalize_candles(data, period):
+    if not data:
+        return []
+    first = data[0]
+    if isinstance(first, dict):
+        if "open" in first:
+            return data
+        data = [[tick["time"], tick["price"]] for tick in data]
+    elif len(first) >= 6:
+        return [{
+            "time": candle[0],
+            "open": candle[1],
+            "close": candle[2],
+            "high": candle[3],
+            "low": candle[4],
+            "ticks": candle[5]
+        } for candle in data]
+    return candles_from_ticks(data, period)
+
+
 def merge_candles(candles_data):
     seen_times = set()
     merged_list = []
@@ -0,0 +1,173 @@
+"""Vectorized NumPy backend for :mod:`quotexapi.utils.processor`.
+
+Functions take tick histories (or `times`/`prices` arrays) and return
+structured arrays of :data:`CANDLE_DTYPE`. For the same input they give
+the same candles as the pure-Python functions; :func:`to_dicts` converts
+back to their list of dicts layout.
+"""
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+CANDLE_FIELDS = ("time", "open", "close", "high", "low", "ticks")
+CANDLE_DTYPE = [
+    ("time", "i8"),
+    ("open", "f8"),
+    ("close", "f8"),
+    ("high", "f8"),
+    ("low", "f8"),
+    ("ticks", "i8"),
+] if np is None else np.dtype([
+    ("time", np.int64),
+    ("open", np.float64),
+    ("close", np.float64),
+    ("high", np.float64),
+    ("low", np.float64),
+    ("ticks", np.int64),
+])
+
+
+def _require_numpy():
+    if np is None:
+        raise ImportError("The NumPy candle backend requires numpy: pip install numpy")
+
+
+def ticks_to_arrays(history):
+    """Split a tick history into `times` and `prices` float64 arrays.
+
+    :param history: The list of `[time, price, ...]` lists or
+        `{"time", "price"}` dicts, a :class:`TickView
+        <quotexapi.ws.objects.ticks.TickView>` or a `(times, prices)` tuple.
+    """
+    _require_numpy()
+    if isinstance(history, tuple):
+        times, prices = history
+        return np.asarray(times, dtype=np.float64), np.asarray(prices, dtype=np.float64)
+    if hasattr(history, "times") and hasattr(history, "prices"):
+        return np.frombuffer(history.times, dtype=np.float64), np.frombuffer(history.prices, dtype=np.float64)
+    if len(history) and isinstance(history[0], dict):
+        times = np.fromiter((tick["time"] for tick in history), np.float64, len(history))
+        prices = np.fromiter((tick["price"] for tick in history), np.float64, len(history))
+        return times, prices
+    times = np.fromiter((tick[0] for tick in history), np.float64, len(history))
+    prices = np.fromiter((tick[1] for tick in history), np.float64, len(history))
+    return times, prices
+
+
+def group_by_period(times, period):
+    """Group tick indexes by `period` bucket, like the dict of lists version.
+
+    Buckets keep the order in which they first appear and ticks keep their
+    order inside a bucket.
+
+    :returns: The tuple `(order, starts, buckets)`: `order` permutes ticks
+        so each bucket is contiguous, `starts` is the offset of each bucket
+        in that order and `buckets` is the bucket number of each group.
+    """
+    _require_numpy()
+    bucket = np.floor_divide(times, period).astype(np.int64)
+    if not bucket.size or np.all(bucket[1:] >= bucket[:-1]):
+        order = np.arange(bucket.size)
+    else:
+        order = np.argsort(bucket, kind="stable")
+        is_start = np.concatenate(([True], bucket[order][1:] != bucket[order][:-1]))
+        group = np.cumsum(is_start) - 1
+        rank = np.argsort(np.argsort(order[is_start], kind="stable"), kind="stable")
+        order = order[np.argsort(rank[group], kind="stable")]
+    grouped = bucket[order]
+    starts = np.flatnonzero(grouped[1:] != grouped[:-1]) + 1
+    starts = np.concatenate(([0], starts)) if grouped.size else starts
+    return order, starts, grouped[starts]
+
+
+def _ohlcv(prices, starts, buckets, period, size):
+    candles = np.empty(starts.size, dtype=CANDLE_DTYPE)
+    if not starts.size:
+        return candles
+    ends = np.append(starts[1:], size)
+    candles["time"] = buckets * period
+    candles["open"] = prices[starts]
+    candles["close"] = prices[ends - 1]
+    candles["high"] = np.maximum.reduceat(prices, starts)
+    candles["low"] = np.minimum.reduceat(prices, starts)
+    candles["ticks"] = ends - starts
+    return candles
+
+
+def calculate_candles(history, period):
+    """Vectorized :func:`calculate_candles <quotexapi.utils.processor.calculate_candles>`.
+
+    The last (still open) candle is dropped, as in the pure-Python version.
+    """
+    times, prices = ticks_to_arrays(history)
+    order, starts, buckets = group_by_period(times, period)
+    return _ohlcv(prices[order], starts, buckets, period, times.size)[:-1]
+
+
+def process_candles(history, period):
+    """Vectorized :func:`process_candles <quotexapi.utils.processor.process_candles>`.
+
+    Expects ticks in time order, as received from the platform. `time` is
+    the candle start, which is `start_time` in the dicts version.
+    """
+    times, prices = ticks_to_arrays(history)
+    bucket = np.floor_divide(times, period).astype(np.int64)
+    starts = np.flatnonzero(bucket[1:] > bucket[:-1]) + 1
+    starts = np.concatenate(([0], starts)) if bucket.size else starts
+    return _ohlcv(prices, starts, bucket[starts], period, times.size)[:-1]
+
+
+def resample(times, prices, period, start=None, end=None):
+    """Resample ticks on a fixed grid of `period` seconds.
+
+    Bucket edges are located with `np.searchsorted`, so ticks must be in
+    time order. Empty buckets are left out.
+
+    :param start: (optional) The first bucket time, default the first tick.
+    :param end: (optional) The time after the last bucket, default after
+        the last tick.
+    :returns: The structured array of :data:`CANDLE_DTYPE`, open candle included.
+    """
+    _require_numpy()
+    times = np.asarray(times, dtype=np.float64)
+    prices = np.asarray(prices, dtype=np.float64)
+    if not times.size:
+        return np.empty(0, dtype=CANDLE_DTYPE)
+    first = int(times[0] // period) if start is None else int(start // period)
+    last = int(times[-1] // period) + 1 if end is None else -(-int(end) // period)
+    edges = np.arange(first, last + 1, dtype=np.int64) * period
+    bounds = np.searchsorted(times, edges, side="left")
+    starts, stops = bounds[:-1], bounds[1:]
+    filled = stops > starts
+    buckets = edges[:-1][filled] // period
+    starts = starts[filled]
+    offset = starts[0] if starts.size else 0
+    stop = stops[filled][-1] if starts.size else 0
+    return _ohlcv(prices[offset:stop], starts - offset, buckets, period, stop - offset)
+
+
+def merge_candles(*candles):
+    """Vectorized :func:`merge_candles <quotexapi.utils.processor.merge_candles>`.
+
+    Concatenates candle arrays, keeps the first candle of each time and
+    sorts by time.
+    """
+    _require_numpy()
+    merged = np.concatenate([np.asarray(item, dtype=CANDLE_DTYPE) for item in candles])
+    _, first = np.unique(merged["time"], return_index=True)
+    return merged[first]
+
+
+def from_dicts(candles):
+    """Convert a list of candle dicts to a structured array."""
+    _require_numpy()
+    return np.array(
+        [tuple(candle[field] for field in CANDLE_FIELDS) for candle in candles],
+        dtype=CANDLE_DTYPE
+    )
+
+
+def to_dicts(candles):
+    """Convert a structured array to the list of candle dicts layout."""
+    return [dict(zip(CANDLE_FIELDS, row)) for row in candles.tolist()]
@@ -0,0 +1,158 @@
+"""Module for Quotex websocket frame capture and replay."""
+import time
+import struct
+import asyncio
+import logging
+import threading
+from typing import NamedTuple, Union
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b"QXCAP1\n"
+RECORD = struct.Struct("<dBI")
+FLAG_SENT = 0x01
+FLAG_BINARY = 0x02
+
+
+class Frame(NamedTuple):
+    """A captured frame, `timestamp` being the `time.monotonic()` of the capture."""
+    timestamp: float
+    sent: bool
+    data: Union[str, bytes]
+
+
+def read_frames(path):
+    """Iterate over the frames of a capture file.
+
+    A frame cut by a crash at the end of the file is ignored.
+
+    :param str path: The capture file.
+    """
+    with open(path, "rb") as file:
+        if file.read(len(MAGIC)) != MAGIC:
+            raise ValueError(f"{path} is not a frame capture file")
+        while True:
+            header = file.read(RECORD.size)
+            if len(header) < RECORD.size:
+                return
+            timestamp, flags, length = RECORD.unpack(header)
+            data = file.read(length)
+            if len(data) < length:
+                return
+            if not flags & FLAG_BINARY:
+                data = data.decode("utf-8")
+            yield Frame(timestamp, bool(flags & FLAG_SENT), data)
+
+
+class FrameRecorder(object):
+    """Class for writing websocket frames to an append-only capture file.
+
+    The file starts with :data:`MAGIC`, then every frame is stored as its
+    monotonic timestamp (float64), a flags byte (:data:`FLAG_SENT`,
+    :data:`FLAG_BINARY`) and the payload length (uint32), followed by the
+    payload. Capturing again to the same file appends to it. Frames may
+    be recorded from the websocket thread.
+    """
+
+    def __init__(self, path, buffering=1 << 16):
+        """
+        :param str path: The capture file.
+        :param int buffering: The write buffer size in bytes.
+        """
+        self.path = path
+        self.file = open(path, "ab", buffering=buffering)
+        if self.file.tell() == 0:
+            self.file.write(MAGIC)
+        self.frames = 0
+        self._lock = threading.Lock()
+
+    def record(self, data, sent=False):
+        """Append a frame.
+
+        :param data: The text or binary frame.
+        :param bool sent: True for outbound frames.
+        """
+        flags = FLAG_SENT if sent else 0
+        if isinstance(data, str):
+            data = data.encode("utf-8")
+        else:
+            flags |= FLAG_BINARY
+        header = RECORD.pack(time.monotonic(), flags, len(data))
+        with self._lock:
+            if self.file is None:
+                return
+            self.file.write(header)
+            self.file.write(data)
+            self.frames += 1
+
+    def flush(self):
+        with self._lock:
+            if self.file is not None:
+                self.file.flush()
+
+    def close(self):
+        with self._lock:
+            if self.file is not None:
+                self.file.close()
+                self.file = None
+
+
+class FrameReplayer(object):
+    """Class for feeding a capture file through a websocket client.
+
+    Received frames are passed to :meth:`WebsocketClient.on_message
+    <quotexapi.ws.client.WebsocketClient.on_message>` in their captured
+    order and with their captured spacing divided by `speed`. Sent frames
+    are not written anywhere, they are only counted.
+    """
+
+    def __init__(self, path):
+        """
+        :param str path: The capture file.
+        """
+        self.path = path
+
+    def frames(self, sent=None):
+        """Iterate over the captured frames.
+
+        :param bool sent: (optional) True for outbound frames only, False
+            for inbound frames only, default both.
+        """
+        for frame in read_frames(self.path):
+            if sent is None or frame.sent == sent:
+                yield frame
+
+    async def replay(self, client, speed=1.0, batch=1000):
+        """Replay the capture through `client`.
+
+        :param client: The instance of :class:`WebsocketClient
+            <quotexapi.ws.client.WebsocketClient>`.
+        :param float speed: The replay speed, e.g. 1 for real time, 10 for
+            ten times faster, None for as fast as possible.
+        :param int batch: At full speed, yield to the event loop after this
+            many frames.
+        :returns: The dict of received and sent frame counts and the
+            replay duration in seconds.
+        """
+        received = sent = 0
+        first = None
+        started_at = time.monotonic()
+        for frame in read_frames(self.path):
+            if frame.sent:
+                sent += 1
+                continue
+            if speed:
+                if first is None:
+                    first = frame.timestamp
+                delay = started_at + (frame.timestamp - first) / speed - time.monotonic()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+            elif received % batch == 0:
+                await asyncio.sleep(0)
+            client.on_message(None, frame.data)
+            received += 1
+        return {
+            "received": received,
+            "sent": sent,
+            "duration": time.monotonic() - started_at
+        }
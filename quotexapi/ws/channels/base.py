@@ -8,9 +8,12 @@ class Base(object):
         """
         self.api = api
 
-    def send_websocket_request(self, data):
+    def send_websocket_request(self, data, priority=None, on_sent=None, handle=None):
         """Send request to Quotex server websocket.
         :param str data: The websocket channel data.
+        :param int priority: (optional) The send queue lane.
+        :param on_sent: (optional) The callable called once the frame is written.
+        :param handle: (optional) The send queue handle withdrawing the frame.
         :returns: The instance of :class:`requests.Response`.
         """
-        return self.api.send_websocket_request(data)
+        return self.api.send_websocket_request(data, priority=priority, on_sent=on_sent, handle=handle)
@@ -1,67 +1,113 @@
+import copy
 import json
 from quotexapi.ws.channels.base import Base
+from quotexapi.ws.send_queue import PRIORITY_ORDER, SendHandle
 from quotexapi.expiration import get_expiration_time_quotex
 
+CHART_SETTINGS = {
+    "chartId": "graph",
+    "chartType": 2,
+    "currentExpirationTime": None,
+    "isFastOption": False,
+    "isFastAmountOption": False,
+    "isIndicatorsMinimized": False,
+    "isIndicatorsShowing": True,
+    "isShortBetElement": False,
+    "chartPeriod": 4,
+    "currentAsset": {
+        "symbol": None
+    },
+    "dealValue": 5,
+    "dealPercentValue": 1,
+    "isVisible": True,
+    "timePeriod": 30,
+    "gridOpacity": 8,
+    "isAutoScrolling": 1,
+    "isOneClickTrade": True,
+    "upColor": "#0FAF59",
+    "downColor": "#FF6251"
+}
+
+ORDER_FRAME = (
+    '42["orders/open",{{"asset":{asset},"amount":{amount},"time":{time},'
+    '"action":{action},"isDemo":{is_demo},"tournamentId":0,'
+    '"requestId":{request_id},"optionType":{option_type}}}]'
+)
+
 
 class Buy(Base):
     """Class for Quotex buy websocket channel."""
 
     name = "buy"
 
-    def __call__(self, price, asset, direction, duration, request_id):
+    def chart_settings(self, asset):
+        """Get the cached chart settings of an asset, created on first use."""
+        settings = self.api.chart_settings.get(asset)
+        if settings is None:
+            settings = copy.deepcopy(CHART_SETTINGS)
+            settings["currentAsset"]["symbol"] = asset
+            self.api.chart_settings[asset] = settings
+        return settings
+
+    def __call__(self, price, asset, direction, duration, request_id, fast=False):
+        """Open an order.
+
+        :param bool fast: (optional) Send only the `orders/open` frame, the
+            chart settings are sent only when the asset or duration changed
+            since the settings last written on this connection.
+
+        Every frame goes in the order lane of the send queue, so the chart
+        settings are written before the order that depends on them.
+
+        :returns: The :class:`SendHandle <quotexapi.ws.send_queue.SendHandle>`
+            of the frames, cancel it to withdraw the order if it was not
+            written yet.
+        """
+        handle = SendHandle()
         option_type = 100
+        expiration = duration
         if "_otc" not in asset:
             option_type = 1
-            duration = get_expiration_time_quotex(
+            expiration = get_expiration_time_quotex(
                 int(self.api.timesync.server_timestamp),
                 duration
             )
 
-        data = f'42["depth/follow", f"{asset}"]'
-        self.send_websocket_request(data)
+        if not fast or self.api.chart_settings_key != (asset, duration):
+            data = f'42["depth/follow","{asset}"]'
+            self.send_websocket_request(data, priority=PRIORITY_ORDER, handle=handle)
 
-        payload = {
-            "chartId": "graph",
-            "settings": {
+            settings = self.chart_settings(asset)
+            settings["currentExpirationTime"] = expiration
+            payload = {
                 "chartId": "graph",
-                "chartType": 2,
-                "currentExpirationTime": duration,
-                "isFastOption": False,
-                "isFastAmountOption": False,
-                "isIndicatorsMinimized": False,
-                "isIndicatorsShowing": True,
-                "isShortBetElement": False,
-                "chartPeriod": 4,
-                "currentAsset": {
-                    "symbol": asset
-                },
-                "dealValue": 5,
-                "dealPercentValue": 1,
-                "isVisible": True,
-                "timePeriod": 30,
-                "gridOpacity": 8,
-                "isAutoScrolling": 1,
-                "isOneClickTrade": True,
-                "upColor": "#0FAF59",
-                "downColor": "#FF6251"
+                "settings": settings
             }
-        }
-        data = f'42["settings/store",{json.dumps(payload)}]'
-        self.send_websocket_request(data)
-
-        payload = {
-            "asset": asset,
-            "amount": price,
-            "time": duration,
-            "action": direction,
-            "isDemo": self.api.account_type,
-            "tournamentId": 0,
-            "requestId": request_id,
-            "optionType": option_type
-        }
+            data = f'42["settings/store",{json.dumps(payload)}]'
+            key = (asset, duration)
+            self.send_websocket_request(
+                data,
+                priority=PRIORITY_ORDER,
+                on_sent=lambda: setattr(self.api, "chart_settings_key", key),
+                handle=handle
+            )
 
-        data = f'42["tick"]'
-        self.send_websocket_request(data)
+        if not fast:
+            data = '42["tick"]'
+            self.send_websocket_request(data, priority=PRIORITY_ORDER, handle=handle)
 
-        data = f'42["orders/open",{json.dumps(payload)}]'
-        self.send_websocket_request(data)
+        latency = self.api.order_latency
+        data = ORDER_FRAME.format(
+            asset=json.dumps(asset),
+            amount=json.dumps(price),
+            time=int(expiration),
+            action=json.dumps(direction),
+            is_demo=json.dumps(self.api.account_type),
+            request_id=json.dumps(request_id),
+            option_type=option_type
+        )
+        latency.mark(request_id, "serialize")
+        latency.track_frame(request_id, data)
+        self.send_websocket_request(data, priority=PRIORITY_ORDER, handle=handle)
+        latency.mark(request_id, "enqueue")
+        return handle
@@ -1,23 +1,33 @@
 """Module for Quotex websocket."""
-import json
 import time
 import logging
 import websocket
-from .. import global_value
+from .decoder import FrameDecoder
+from .packet import PacketDecoder, BINARY_EVENT
+from .objects.candles import CandleSeries
+from .transport import AsyncWebSocketApp, ThreadWebSocketApp, TRANSPORT_ASYNCIO
+from quotexapi.utils.metrics import frame_event, frame_size
 
 logger = logging.getLogger(__name__)
 
+ROLE_ACTIVE = "active"
+ROLE_STANDBY = "standby"
+
 
 class WebsocketClient(object):
     """Class for work with Quotex API websocket."""
 
-    def __init__(self, api):
+    def __init__(self, api, role=ROLE_ACTIVE):
         """
         :param api: The instance of :class:`QuotexAPI
             <quotexapi.api.QuotexAPI>`.
+        :param str role: "active", or "standby" for the spare connection of
+            :class:`WarmStandby <quotexapi.ws.standby.WarmStandby>`.
         trace_ws: Enables and disable `enableTrace` in WebSocket Client.
         """
         self.api = api
+        self.role = role
+        self.connected = False
         self.headers = {
             "User-Agent": self.api.session_data.get("user_agent"),
             "Origin": self.api.https_url,
@@ -25,7 +35,12 @@ class WebsocketClient(object):
         }
 
         websocket.enableTrace(self.api.trace_ws)
-        self.wss = websocket.WebSocketApp(
+        options = {}
+        app_class = ThreadWebSocketApp
+        if self.api.transport == TRANSPORT_ASYNCIO:
+            app_class = AsyncWebSocketApp
+            options["compression"] = self.api.compression
+        self.wss = app_class(
             self.api.wss_url,
             on_message=self.on_message,
             on_error=self.on_error,
@@ -35,148 +50,334 @@ class WebsocketClient(object):
             on_pong=self.on_pong,
             header=self.headers,
             # cookie=self.api.cookies
+            **options
         )
+        self.wss.on_sent = self.on_sent
+        self.frame_counters = self.api.frame_counters
+        self.decoder = FrameDecoder(self.api.json_backend)
+        self.created_at = time.perf_counter()
+        self.received_at = None
+        self.parsed_at = None
+        self.packets = PacketDecoder(self.decoder.loads, self.decoder.decode_binary)
+        self.handlers = {
+            "authorization/reject": self.on_authorization_reject,
+            "s_authorization": self.on_authorization,
+            "instruments/list": self.on_instruments_list,
+            "settings/list": self.on_settings_list,
+            "history/list/v2": self.on_history_list,
+            "quotes/stream": self.on_quotes_stream,
+            "s_orders/open": self.on_order_opened,
+            "s_orders/close": self.on_orders_closed,
+        }
 
     def on_message(self, wss, message):
-        """Method to process websocket messages."""
-        global_value.ssl_Mutual_exclusion = True
-        current_time = time.localtime()
-        if current_time.tm_sec in [0, 5, 10, 15, 20, 30, 40, 50]:
-            self.wss.send('42["tick"]')
+        """Method to process websocket messages.
+
+        The Socket.IO event name is parsed once per frame and the payload is
+        dispatched through :attr:`handlers`, then to the handlers registered
+        by users on :class:`MessageRouter <quotexapi.ws.router.MessageRouter>`.
+        Binary events are assembled by :class:`PacketDecoder
+        <quotexapi.ws.packet.PacketDecoder>` and timed from the arrival of
+        their header.
+        """
+        received_at = time.perf_counter()
+        sizes = getattr(wss, "received_size", None) or (frame_size(message), None)
+        if self.role == ROLE_STANDBY:
+            event = frame_event(message) if isinstance(message, str) else None
+            self.frame_counters.record("received", event, *sizes)
+            if self.api.standby is not None:
+                self.api.standby.on_message(self, message, received_at)
+            return
+        if self.api.frame_recorder is not None:
+            self.api.frame_recorder.record(message)
+        self.process(message, received_at, sizes)
+
+    def process(self, message, received_at, sizes=None):
+        """Decode a frame of the active websocket and dispatch its packet.
+
+        :param sizes: (optional) The `(size, wire_size)` counted for the frame.
+        """
         try:
-            if "authorization/reject" in str(message):
-                logger.info("Token rejeitado, fazendo reconexão automática.")
-                global_value.check_rejected_connection = 1
-            elif "s_authorization" in str(message):
-                global_value.check_accepted_connection = 1
-                global_value.check_rejected_connection = 0
-            elif "instruments/list" in str(message):
-                global_value.started_listen_instruments = True
-            try:
-                message = message[1:].decode()
+            packet = self.packets.feed(message, received_at)
+        except Exception as error:
+            logger.debug(f"Failed to decode websocket message: {error}")
+            return
+        if packet is None:
+            if sizes is not None:
+                self.count_attachment(*sizes)
+            return
+        if sizes is not None:
+            self.frame_counters.record("received", packet.event, *sizes)
+        self.dispatch(packet)
+
+    def dispatch(self, packet):
+        """Dispatch a complete packet of the active websocket.
+
+        Packets buffered by a promoted standby are dispatched here too;
+        during the switchover, packets already received by the old
+        connection are dropped by :meth:`WarmStandby.accept
+        <quotexapi.ws.standby.WarmStandby.accept>`.
+        """
+        try:
+            standby = self.api.standby
+            if standby is not None and packet.event is not None:
+                if not standby.accept(packet):
+                    return
+            packet_type, event, message, received_at, _ = packet
+            if packet_type == "3":
+                self.api.heartbeat.on_pong()
+                return
+            if packet_type.startswith("0{"):
+                self.api.heartbeat.on_open_packet(packet_type)
+                return
+            if packet_type == "41":
+                logger.info("Evento de desconexão disparado pela plataforma, fazendo reconexão automática.")
+                self.on_disconnect()
+                return
+            if event is None:
+                return
+            if packet_type == BINARY_EVENT:
                 logger.debug(message)
-                message = json.loads(message)
                 self.api.wss_message = message
-                if "call" in str(message) or 'put' in str(message):
-                    self.api.instruments = message
-                if message.get("signals"):
-                    time_in = message.get("time")
-                    for i in message["signals"]:
-                        try:
-                            self.api.signal_data[i[0]] = {}
-                            self.api.signal_data[i[0]][i[2]] = {}
-                            self.api.signal_data[i[0]][i[2]]["dir"] = i[1][0]["signal"]
-                            self.api.signal_data[i[0]][i[2]]["duration"] = i[1][0]["timeFrame"]
-                        except:
-                            self.api.signal_data[i[0]] = {}
-                            self.api.signal_data[i[0]][time_in] = {}
-                            self.api.signal_data[i[0]][time_in]["dir"] = i[1][0][1]
-                            self.api.signal_data[i[0]][time_in]["duration"] = i[1][0][0]
-                elif message.get("liveBalance") or message.get("demoBalance"):
-                    self.api.account_balance = message
-                elif message.get("position"):
-                    self.api.top_list_leader = message
-                elif len(message) == 1 and message.get("profit") > -1:
-                    self.api.profit_today = message
-                elif message.get("index"):
-                    self.api.historical_candles = message
-                    # self.api.candles.candles_data = message
-                    self.api.candle_close_timestamp = message.get("closeTimestamp")
-                elif message.get("id"):
-                    self.api.buy_successful = message
-                    self.api.buy_id = message["id"]
-                    self.api.candle_close_timestamp = message.get("closeTimestamp")
-                elif message.get("ticket"):
-                    self.api.sold_options_respond = message
-                elif message.get("deals"):
-                    for get_m in message["deals"]:
-                        self.api.profit_in_operation = get_m["profit"]
-                        get_m["win"] = True if message["profit"] > 0 else False
-                        get_m["game_state"] = 1
-                        self.api.listinfodata.set(
-                            get_m["win"],
-                            get_m["game_state"],
-                            get_m["id"]
-                        )
-                elif message.get("isDemo") and message.get("balance"):
-                    self.api.training_balance_edit_request = message
-                elif message.get("error"):
-                    global_value.websocket_error_reason = message.get("error")
-                    global_value.check_websocket_if_error = True
-                    if global_value.websocket_error_reason == "not_money":
-                        self.api.account_balance = {"liveBalance": 0}
-                elif not message.get("list") == []:
-                    self.api.wss_message = message
-            except:
-                pass
-
-            if str(message) == "41":
-                logger.info("Evento de desconexão disparado pela plataforma, fazendo reconexão automática.")
-                global_value.check_websocket_if_connect = 0
-            if "51-" in str(message):
-                self.api._temp_status = str(message)
-            elif self.api._temp_status == """451-["settings/list",{"_placeholder":true,"num":0}]""":
-                self.api.settings_list = message
-                self.api._temp_status = ""
-            elif self.api._temp_status == """451-["history/list/v2",{"_placeholder":true,"num":0}]""":
-                if message.get("asset") == self.api.current_asset:
-                    self.api.candles.candles_data = message["history"]
-                    self.api.candle_v2_data[message["asset"]] = message
-                    self.api.candle_v2_data[message["asset"]]["candles"] = [{
-                        "time": candle[0],
-                        "open": candle[1],
-                        "close": candle[2],
-                        "high": candle[3],
-                        "low": candle[4],
-                        "ticks": candle[5]
-                    } for candle in message["candles"]]
-            elif len(message[0]) == 4:
+            message = self.decoder.convert(event, message)
+            self.received_at = received_at
+            self.parsed_at = time.perf_counter()
+            self.handlers.get(event, self.on_event_data)(message)
+            self.api.router.dispatch(event, message)
+        except Exception as error:
+            logger.debug(f"Failed to process websocket message: {error}")
+
+    def count_attachment(self, size, wire_size):
+        """Count a binary frame under the event of the packet it belongs to."""
+        event = self.packets.pending[0].event if self.packets.pending else None
+        self.frame_counters.record("received", event, size, wire_size)
+
+    def on_sent(self, wss, data, wire_size):
+        """Method to count the frames written on the socket."""
+        self.frame_counters.record("sent", frame_event(data), frame_size(data), wire_size)
+        if self.role != ROLE_ACTIVE:
+            return
+        if self.api.frame_recorder is not None:
+            self.api.frame_recorder.record(data, sent=True)
+        if self.api.standby is not None:
+            self.api.standby.mirror(data)
+
+    def on_authorization_reject(self, message):
+        logger.info("Token rejeitado, fazendo reconexão automática.")
+        self.api.state.check_rejected_connection = 1
+
+    def on_authorization(self, message):
+        self.api.state.check_accepted_connection = 1
+        self.api.state.check_rejected_connection = 0
+
+    def on_instruments_list(self, message):
+        self.api.state.started_listen_instruments = True
+        self.api.instruments = message
+        self.api.instrument_catalogue.update(message)
+        self.api.pending.resolve("instruments", message)
+
+    def on_settings_list(self, message):
+        self.api.settings_list = message
+
+    def on_history_list(self, message):
+        asset = message.get("asset")
+        if asset is None:
+            return
+        if asset == self.api.current_asset:
+            self.api.candles.candles_data = message["history"]
+        self.api.candle_v2_data[asset] = message
+        message["candles"] = CandleSeries.from_rows(message["candles"])
+        self.api.pending.resolve(("candles", asset), message)
+
+    def on_quotes_stream(self, message):
+        if not message:
+            return
+        if self.api.disconnected_at is not None and self.created_at > self.api.disconnected_at:
+            self.api.record_time_to_data()
+        if len(message[0]) == 4:
+            if self.api.market_data is not None:
+                # Attached to a hub: the owner alone fills the shared buffers.
+                return
+            for tick in message:
+                prices = self.api.realtime_price.get(tick[0])
+                if prices is not None:
+                    prices.append(tick[1], tick[2])
+                aggregator = self.api.candle_aggregators.get(tick[0])
+                if aggregator is not None:
+                    aggregator.update(tick[1], tick[2])
+        elif len(message[0]) == 2:
+            for i in message:
                 result = {
-                    "time": message[0][1],
-                    "price": message[0][2]
-                }
-                self.api.realtime_price[message[0][0]].append(result)
-            elif len(message[0]) == 2:
-                for i in message:
-                    result = {
-                        "sentiment": {
-                            "sell": 100 - int(i[1]),
-                            "buy": int(i[1])
-                        }
+                    "sentiment": {
+                        "sell": 100 - int(i[1]),
+                        "buy": int(i[1])
                     }
-                    self.api.realtime_sentiment[i[0]] = result
-        except:
+                }
+                self.api.realtime_sentiment[i[0]] = result
+                self.api.pending.resolve(("sentiment", i[0]), result)
+
+    def on_order_opened(self, message):
+        if not message.get("id"):
+            if message.get("error"):
+                return self.on_error_reply(message, order=True)
+            return self.on_event_data(message)
+        self.api.buy_successful = message
+        self.api.buy_id = message["id"]
+        self.api.candle_close_timestamp = message.get("closeTimestamp")
+        self.resolve_order(message)
+
+    def resolve_order(self, message):
+        """Wake the `Quotex.buy` waiting for this reply.
+
+        Replies are matched on their `requestId`. Replies without one go to
+        the oldest order still waiting.
+        """
+        request_id = message.get("requestId")
+        try:
+            if request_id is None:
+                request_id = self.api.order_requests.popleft()
+            else:
+                self.api.order_requests.remove(request_id)
+        except (IndexError, ValueError):
             pass
-        global_value.ssl_Mutual_exclusion = False
+        self.api.order_latency.mark(request_id, "first_byte", self.received_at)
+        self.api.order_latency.mark(request_id, "parse", self.parsed_at)
+        return self.api.pending.resolve(("buy", request_id), message)
+
+    def on_orders_closed(self, message):
+        if not message.get("deals"):
+            return self.on_event_data(message)
+        for get_m in message["deals"]:
+            self.api.profit_in_operation = get_m["profit"]
+            get_m["win"] = get_m["profit"] > 0
+            get_m["game_state"] = 1
+            self.api.listinfodata.set(
+                get_m["win"],
+                get_m["game_state"],
+                get_m["id"],
+                get_m["profit"]
+            )
+            self.api.pending.resolve(("deal", get_m["id"]), get_m)
+
+    def on_event_data(self, message):
+        """Method to process payloads of events without a dedicated handler."""
+        if isinstance(message, list):
+            return self.on_quotes_stream(message)
+        if not isinstance(message, dict):
+            return
+        if message.get("signals"):
+            time_in = message.get("time")
+            for i in message["signals"]:
+                try:
+                    self.api.signal_data[i[0]] = {}
+                    self.api.signal_data[i[0]][i[2]] = {}
+                    self.api.signal_data[i[0]][i[2]]["dir"] = i[1][0]["signal"]
+                    self.api.signal_data[i[0]][i[2]]["duration"] = i[1][0]["timeFrame"]
+                except:
+                    self.api.signal_data[i[0]] = {}
+                    self.api.signal_data[i[0]][time_in] = {}
+                    self.api.signal_data[i[0]][time_in]["dir"] = i[1][0][1]
+                    self.api.signal_data[i[0]][time_in]["duration"] = i[1][0][0]
+        elif message.get("liveBalance") or message.get("demoBalance"):
+            self.api.account_balance = message
+            self.api.pending.resolve("balance", message)
+        elif message.get("position"):
+            self.api.top_list_leader = message
+        elif len(message) == 1 and message.get("profit", -1) > -1:
+            self.api.profit_today = message
+        elif message.get("index"):
+            self.api.historical_candles = message
+            self.api.candle_close_timestamp = message.get("closeTimestamp")
+            self.api.pending.resolve(("history", message["index"]), message)
+            self.api.pending.resolve("history", message)
+        elif message.get("id"):
+            self.on_order_opened(message)
+        elif message.get("ticket"):
+            self.api.sold_options_respond = message
+            self.api.pending.resolve("sell_option", message)
+        elif message.get("deals"):
+            self.on_orders_closed(message)
+        elif message.get("isDemo") and message.get("balance"):
+            self.api.training_balance_edit_request = message
+            self.api.pending.resolve("training_balance", message)
+        elif message.get("error"):
+            self.on_error_reply(message, order=message.get("requestId") is not None)
+
+    def on_error_reply(self, message, order=False):
+        """Method to process `{"error": ...}` payloads.
+
+        :param bool order: True if the error answers an order, i.e. it came
+            as `s_orders/open` or carries a `requestId`. Other errors must
+            not wake the oldest order still waiting.
+        """
+        self.api.state.websocket_error_reason = message.get("error")
+        self.api.state.check_websocket_if_error = True
+        if self.api.state.websocket_error_reason == "not_money":
+            self.api.account_balance = {"liveBalance": 0}
+        if order:
+            self.resolve_order(message)
+        self.api.pending.resolve("error", message)
 
     def on_error(self, wss, error):
         """Method to process websocket errors."""
+        if self.role == ROLE_STANDBY:
+            logger.debug(f"Standby websocket error: {error}")
+            if self.api.standby is not None:
+                self.api.standby.lost(self)
+            return
+        if self.api.websocket_client is not self:
+            return
         logger.error(error)
-        global_value.websocket_error_reason = str(error)
-        global_value.check_websocket_if_error = True
+        self.api.state.websocket_error_reason = str(error)
+        self.api.state.check_websocket_if_error = True
 
     def on_open(self, wss):
         """Method to process websocket open."""
+        self.connected = True
+        if self.role == ROLE_STANDBY:
+            if self.api.standby is None:
+                return self.wss.close()
+            return self.api.standby.on_open(self)
         logger.info("Websocket client connected.")
-        global_value.check_websocket_if_connect = 1
-        asset_name = self.api.current_asset
-        period = self.api.current_period
+        self.api.state.check_websocket_if_connect = 1
+        self.api.chart_settings_key = None
+        self.packets.reset()
         self.wss.send('42["tick"]')
         self.wss.send('42["indicator/list"]')
         self.wss.send('42["drawing/load"]')
         self.wss.send('42["pending/list"]')
-        self.wss.send('42["instruments/update",{"asset":"%s","period":%d}]' % (asset_name, period))
-        self.wss.send('42["depth/follow","%s"]' % asset_name)
         self.wss.send('42["chart_notification/get"]')
         self.wss.send('42["tick"]')
+        self.api.send_queue.resume()
 
     def on_close(self, wss, close_status_code, close_msg):
         """Method to process websocket close."""
+        self.connected = False
+        if self.role == ROLE_STANDBY:
+            if self.api.standby is not None:
+                self.api.standby.lost(self)
+            return
         logger.info("Websocket connection closed.")
-        global_value.check_websocket_if_connect = 0
+        self.on_disconnect()
+
+    def on_disconnect(self):
+        """Flag the connection as lost, unless a newer client replaced this one.
+
+        A ready :class:`WarmStandby <quotexapi.ws.standby.WarmStandby>`
+        connection is promoted instead.
+        """
+        if self.api.websocket_client is not self:
+            return
+        if self.api.standby is not None and self.api.standby.promote(self):
+            return
+        self.api.send_queue.pause()
+        if self.api.disconnected_at is None:
+            self.api.disconnected_at = time.perf_counter()
+        self.api.state.check_websocket_if_connect = 0
+        self.api.pending.resolve("disconnect", True)
 
     def on_ping(self, wss, ping_msg):
         pass
 
     def on_pong(self, wss, pong_msg):
-        self.wss.send("2")
+        pass
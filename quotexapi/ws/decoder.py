@@ -0,0 +1,135 @@
+"""Module for Quotex websocket frame decoder."""
+import json
+import logging
+from typing import NamedTuple
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+logger = logging.getLogger(__name__)
+
+BACKEND_ORJSON = "orjson"
+BACKEND_MSGSPEC = "msgspec"
+BACKEND_JSON = "json"
+BACKENDS = (BACKEND_ORJSON, BACKEND_MSGSPEC, BACKEND_JSON)
+
+
+class Quote(NamedTuple):
+    """A `quotes/stream` tick, still indexable as the `[asset, time, price, direction]` list."""
+    asset: str
+    time: float
+    price: float
+    direction: int
+
+
+class Deal(dict):
+    """A closed deal of `s_orders/close`, a dict with typed attribute access."""
+
+    __slots__ = ()
+
+    @property
+    def id(self) -> str:
+        return self["id"]
+
+    @property
+    def asset(self) -> str:
+        return self.get("asset")
+
+    @property
+    def amount(self) -> float:
+        return float(self.get("amount", 0))
+
+    @property
+    def profit(self) -> float:
+        return float(self.get("profit", 0))
+
+    @property
+    def open_time(self):
+        return self.get("openTime")
+
+    @property
+    def close_time(self):
+        return self.get("closeTime")
+
+    @property
+    def command(self) -> int:
+        return self.get("command")
+
+
+def to_quotes(payload):
+    if not isinstance(payload, list):
+        return payload
+    make = Quote._make
+    return [make(row) if len(row) == 4 else row for row in payload]
+
+
+def to_deals(payload):
+    if isinstance(payload, dict) and payload.get("deals"):
+        payload["deals"] = [Deal(deal) for deal in payload["deals"]]
+    return payload
+
+
+TYPED_EVENTS = {
+    "quotes/stream": to_quotes,
+    "s_orders/close": to_deals,
+}
+
+
+def available_backend():
+    """Get the fastest installed backend."""
+    if orjson is not None:
+        return BACKEND_ORJSON
+    if msgspec is not None:
+        return BACKEND_MSGSPEC
+    return BACKEND_JSON
+
+
+class FrameDecoder(object):
+    """Class for decoding websocket payloads.
+
+    JSON is parsed with orjson or msgspec when installed and the standard
+    library otherwise. Binary frames are parsed without copying their
+    payload when the backend accepts memoryviews. Hot events listed in
+    :data:`TYPED_EVENTS` are converted to typed records; candles are
+    typed by :class:`CandleSeries <quotexapi.ws.objects.candles.CandleSeries>`.
+    """
+
+    def __init__(self, backend=None):
+        """
+        :param str backend: (optional) "orjson", "msgspec" or "json",
+            default the fastest installed.
+        """
+        backend = backend or available_backend()
+        if backend not in BACKENDS:
+            raise ValueError(f"Unknown JSON backend: {backend}")
+        if backend == BACKEND_ORJSON and orjson is None:
+            raise ImportError("The orjson backend requires orjson: pip install orjson")
+        if backend == BACKEND_MSGSPEC and msgspec is None:
+            raise ImportError("The msgspec backend requires msgspec: pip install msgspec")
+        self.backend = backend
+        if backend == BACKEND_ORJSON:
+            self.loads = orjson.loads
+        elif backend == BACKEND_MSGSPEC:
+            self.loads = msgspec.json.Decoder().decode
+        else:
+            self.loads = json.loads
+
+    def decode_binary(self, message):
+        """Decode a binary frame, skipping its leading `\\x04` byte."""
+        if self.backend == BACKEND_JSON:
+            return self.loads(message[1:])
+        return self.loads(memoryview(message)[1:])
+
+    def convert(self, event, payload):
+        """Convert the payload of a hot event to typed records."""
+        typed = TYPED_EVENTS.get(event)
+        if typed is None:
+            return payload
+        return typed(payload)
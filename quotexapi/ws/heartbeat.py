@@ -0,0 +1,100 @@
+"""Module for Quotex websocket heartbeat."""
+import json
+import time
+import random
+import asyncio
+import logging
+
+logger = logging.getLogger(__name__)
+
+TICK_FRAME = '42["tick"]'
+PING_FRAME = "2"
+
+
+class Heartbeat(object):
+    """Class for the keepalive timers of a websocket connection.
+
+    One task on the event loop sends exactly one `42["tick"]` per
+    `tick_interval` (plus or minus `jitter`) and the Engine.IO ping `2`
+    every `pingInterval` announced by the server in the open packet. If the
+    matching pong `3` does not arrive within `pingTimeout`, the socket is
+    closed so the connection can be re-established.
+    """
+
+    def __init__(self, api, tick_interval=5.0, jitter=0.5):
+        """
+        :param api: The instance of :class:`QuotexAPI <quotexapi.api.QuotexAPI>`.
+        :param float tick_interval: Seconds between ticks, 0 disables them.
+        :param float jitter: The maximum random shift of each tick, in seconds.
+        """
+        self.api = api
+        self.tick_interval = tick_interval
+        self.jitter = jitter
+        self.ping_interval = 25.0
+        self.ping_timeout = 20.0
+        self.ping_sent_at = None
+        self.pong_at = None
+        self.task = None
+
+    def start(self):
+        """Start the timers on the running loop."""
+        self.stop()
+        self.ping_sent_at = None
+        self.pong_at = None
+        self.task = asyncio.get_running_loop().create_task(self.run())
+
+    def stop(self):
+        if self.task is not None:
+            self.task.cancel()
+            self.task = None
+
+    def on_open_packet(self, packet):
+        """Read the ping timers of the Engine.IO open packet `0{...}`."""
+        try:
+            options = json.loads(packet[1:])
+        except ValueError:
+            return
+        if options.get("pingInterval"):
+            self.ping_interval = options["pingInterval"] / 1000
+        if options.get("pingTimeout"):
+            self.ping_timeout = options["pingTimeout"] / 1000
+
+    def on_pong(self):
+        self.pong_at = time.monotonic()
+
+    def next_tick(self, now):
+        return now + self.tick_interval + random.uniform(-self.jitter, self.jitter)
+
+    def waiting_pong(self):
+        if self.ping_sent_at is None:
+            return False
+        return self.pong_at is None or self.pong_at < self.ping_sent_at
+
+    async def run(self):
+        now = time.monotonic()
+        next_tick = self.next_tick(now)
+        next_ping = now + self.ping_interval
+        while True:
+            now = time.monotonic()
+            connected = self.api.state.check_websocket_if_connect == 1
+            if self.tick_interval and now >= next_tick:
+                if connected:
+                    self.api.send_websocket_request(TICK_FRAME)
+                next_tick = self.next_tick(now)
+            if now >= next_ping:
+                if connected:
+                    self.api.send_websocket_request(PING_FRAME)
+                    self.ping_sent_at = now
+                next_ping = now + self.ping_interval
+            if not connected:
+                self.ping_sent_at = None
+            elif self.waiting_pong() and now - self.ping_sent_at > self.ping_timeout:
+                logger.warning(f"Engine.IO pong not received in {self.ping_timeout} seconds, closing websocket.")
+                self.ping_sent_at = None
+                client = self.api.websocket_client
+                client.on_disconnect()
+                client.wss.close()
+            deadline = min(next_tick if self.tick_interval else next_ping, next_ping)
+            if self.waiting_pong():
+                deadline = min(deadline, self.ping_sent_at + self.ping_timeout + 0.001)
+            await asyncio.sleep(max(0.0, deadline - time.monotonic()))
@@ -1,14 +1,41 @@
+from array import array
+from bisect import bisect_left
 from quotexapi.ws.objects.base import Base
 
 
+CANDLE_FIELDS = ("time", "open", "close", "high", "low", "ticks")
+CANDLE_TYPECODES = ("q", "d", "d", "d", "d", "q")
+
+
 class Candle(object):
-    """Class for Quotex candle."""
+    """Class for Quotex candle.
+
+    A candle wraps a raw `[time, open, close, high, low, ticks]` list, or is
+    a view on one row of a :class:`CandleSeries` when `index` is given.
+    """
 
-    def __init__(self, candle_data):
+    __slots__ = ("_data", "_index")
+
+    def __init__(self, candle_data, index=None):
         """
-        :param candle_data: The list of candles data.
+        :param candle_data: The list of candles data, or the columns of a
+            :class:`CandleSeries`.
+        :param int index: (optional) The row of the candle in the columns.
         """
-        self.__candle_data = candle_data
+        self._data = candle_data
+        self._index = index
+
+    def _get(self, field):
+        if self._index is None:
+            return self._data[field]
+        return self._data[field][self._index]
+
+    def __repr__(self):
+        return f"Candle({self.to_dict()})"
+
+    def to_dict(self):
+        """Get the candle as a `{"time", "open", ...}` dict."""
+        return {name: self._get(field) for field, name in enumerate(CANDLE_FIELDS)}
 
     @property
     def candle_time(self):
@@ -16,7 +43,7 @@ class Candle(object):
 
         :returns: The candle time.
         """
-        return self.__candle_data[0]
+        return self._get(0)
 
     @property
     def candle_open(self):
@@ -24,7 +51,7 @@ class Candle(object):
 
         :returns: The candle open value.
         """
-        return self.__candle_data[1]
+        return self._get(1)
 
     @property
     def candle_close(self):
@@ -32,7 +59,7 @@ class Candle(object):
 
         :returns: The candle close value.
         """
-        return self.__candle_data[2]
+        return self._get(2)
 
     @property
     def candle_high(self):
@@ -40,7 +67,7 @@ class Candle(object):
 
         :returns: The candle high value.
         """
-        return self.__candle_data[3]
+        return self._get(3)
 
     @property
     def candle_low(self):
@@ -48,7 +75,15 @@ class Candle(object):
 
         :returns: The candle low value.
         """
-        return self.__candle_data[4]
+        return self._get(4)
+
+    @property
+    def candle_ticks(self):
+        """Property to get candle ticks count.
+
+        :returns: The candle ticks count.
+        """
+        return self._get(5)
 
     @property
     def candle_type(self):
@@ -62,6 +97,90 @@ class Candle(object):
             return "red"
 
 
+class CandleSeries(object):
+    """Class for a columnar, read-only series of Quotex candles.
+
+    time and ticks are int64 and open/close/high/low float64 contiguous
+    columns, the same layout as the NumPy candle backend.
+    Indexing returns :class:`Candle` views, slicing returns a series sharing
+    the same memory, and columns can be exported to NumPy or pandas without
+    copying.
+    """
+
+    def __init__(self, columns=None):
+        """
+        :param columns: The tuple of six column buffers, in
+            :data:`CANDLE_FIELDS` order.
+        """
+        if columns is None:
+            columns = tuple(array(typecode) for typecode in CANDLE_TYPECODES)
+        self.columns = tuple(memoryview(column) for column in columns)
+
+    @classmethod
+    def from_rows(cls, rows):
+        """Build a series from `[time, open, close, high, low, ticks]` lists
+        or candle dicts."""
+        columns = tuple(array(typecode) for typecode in CANDLE_TYPECODES)
+        for row in rows:
+            if isinstance(row, dict):
+                row = [row.get(name, 0) for name in CANDLE_FIELDS]
+            columns[0].append(int(row[0]))
+            for column, value in zip(columns[1:5], row[1:5]):
+                column.append(value)
+            columns[5].append(int(row[5]) if len(row) > 5 else 0)
+        return cls(columns)
+
+    def __len__(self):
+        return len(self.columns[0])
+
+    def __getitem__(self, item):
+        if isinstance(item, slice):
+            return CandleSeries(tuple(column[item] for column in self.columns))
+        size = len(self)
+        if item < 0:
+            item += size
+        if not 0 <= item < size:
+            raise IndexError("candle index out of range")
+        return Candle(self.columns, item)
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield Candle(self.columns, index)
+
+    def column(self, name):
+        """Get a column by name, e.g. `series.column("close")`."""
+        return self.columns[CANDLE_FIELDS.index(name)]
+
+    @property
+    def times(self):
+        return self.columns[0]
+
+    def index_of(self, timestamp):
+        """Get the index of the first candle at or after `timestamp`."""
+        return bisect_left(self.columns[0], timestamp)
+
+    def between(self, start, end):
+        """Get the candles with `start <= time < end`, without copying."""
+        return self[self.index_of(start):self.index_of(end)]
+
+    def to_dicts(self):
+        """Get the candles as the list of `{"time", "open", ...}` dicts."""
+        return [
+            dict(zip(CANDLE_FIELDS, row))
+            for row in zip(*(column.tolist() for column in self.columns))
+        ]
+
+    def to_numpy(self):
+        """Get the columns as a dict of NumPy arrays sharing this memory."""
+        import numpy as np
+        return {name: np.asarray(column) for name, column in zip(CANDLE_FIELDS, self.columns)}
+
+    def to_pandas(self):
+        """Get the candles as a :class:`pandas.DataFrame` over the NumPy columns."""
+        import pandas as pd
+        return pd.DataFrame(self.to_numpy(), copy=False)
+
+
 class Candles(Base):
     """Class for Quotex Candles websocket object."""
 
@@ -0,0 +1,105 @@
+"""Module for Quotex instruments websocket object."""
+from typing import NamedTuple
+from quotexapi.ws.objects.base import Base
+
+
+class Instrument(NamedTuple):
+    """An asset of the `instruments/list` frame."""
+    id: int
+    symbol: str
+    name: str
+    type: str
+    payment: float
+    turbo_payment: float
+    is_open: bool
+    profit_1m: float
+    profit_5m: float
+    raw: list
+
+    @classmethod
+    def from_row(cls, row):
+        """Build the record from a raw `instruments/list` row."""
+        return cls(
+            id=row[0],
+            symbol=row[1],
+            name=row[2].replace("\n", ""),
+            type=row[3],
+            payment=row[5],
+            turbo_payment=row[18],
+            is_open=row[14],
+            profit_1m=row[-9],
+            profit_5m=row[-8],
+            raw=row
+        )
+
+
+class Instruments(Base):
+    """Class for the Quotex instruments catalogue.
+
+    Records are indexed by symbol, asset id and display name, so lookups
+    of open status and payouts are O(1). :meth:`update` only rebuilds the
+    records whose row changed.
+    """
+
+    def __init__(self):
+        super(Instruments, self).__init__()
+        self.__name = "instruments"
+        self.by_symbol = {}
+        self.by_id = {}
+        self.by_name = {}
+
+    def __len__(self):
+        return len(self.by_symbol)
+
+    def __iter__(self):
+        return iter(list(self.by_symbol.values()))
+
+    def __contains__(self, symbol):
+        return symbol in self.by_symbol
+
+    def get(self, key, default=None):
+        """Get an instrument by symbol, asset id or display name."""
+        return self.by_symbol.get(key) or self.by_id.get(key) or self.by_name.get(key, default)
+
+    def update(self, rows, replace=True):
+        """Apply an `instruments/list` frame.
+
+        :param rows: The raw instrument rows.
+        :param bool replace: Remove the instruments missing from `rows`.
+        :returns: The number of added or changed instruments.
+        """
+        changed = 0
+        seen = set()
+        for row in rows:
+            symbol = row[1]
+            seen.add(symbol)
+            current = self.by_symbol.get(symbol)
+            if current is not None and current.raw == row:
+                continue
+            if current is not None:
+                self._remove(current)
+            instrument = Instrument.from_row(row)
+            self.by_symbol[symbol] = instrument
+            self.by_id[instrument.id] = instrument
+            self.by_name[instrument.name] = instrument
+            changed += 1
+        if replace:
+            for symbol in [symbol for symbol in self.by_symbol if symbol not in seen]:
+                self._remove(self.by_symbol[symbol])
+        return changed
+
+    def _remove(self, instrument):
+        self.by_symbol.pop(instrument.symbol, None)
+        if self.by_id.get(instrument.id) is instrument:
+            del self.by_id[instrument.id]
+        if self.by_name.get(instrument.name) is instrument:
+            del self.by_name[instrument.name]
+
+    def is_open(self, symbol):
+        instrument = self.by_symbol.get(symbol)
+        return bool(instrument and instrument.is_open)
+
+    def payout(self, symbol):
+        """Get the payout of an asset or None if it is unknown."""
+        instrument = self.by_symbol.get(symbol)
+        return instrument.payment if instrument else None
@@ -11,10 +11,11 @@ class ListInfoData(Base):
         self.__name = "listInfoData"
         self.listinfodata_dict = {}
 
-    def set(self, win, game_state, id_number):
+    def set(self, win, game_state, id_number, profit=None):
         self.listinfodata_dict[id_number] = {
             "win": win,
-            "game_state": game_state
+            "game_state": game_state,
+            "profit": profit
         }
 
     def delete(self, id_number):
@@ -22,3 +23,13 @@ class ListInfoData(Base):
 
     def get(self, id_number):
         return self.listinfodata_dict[id_number]
+
+    def pop(self, id_number, default=None):
+        return self.listinfodata_dict.pop(id_number, default)
+
+    def settled(self, id_number):
+        """Get the result of a closed deal or None while it is open."""
+        result = self.listinfodata_dict.get(id_number)
+        if result is not None and result["game_state"] == 1:
+            return result
+        return None
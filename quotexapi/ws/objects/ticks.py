@@ -0,0 +1,114 @@
+"""Module for Quotex realtime price websocket object."""
+from array import array
+
+
+class TickView(object):
+    """Class for a read-only window over the ticks of a :class:`TickBuffer`.
+
+    The window shares memory with the buffer: `times` and `prices` are
+    memoryviews of float64, so they can be wrapped with `numpy.frombuffer`
+    without copying. The buffer keeps writing over its oldest ticks, so a
+    view is only stable until `capacity` more ticks arrive; use
+    :meth:`to_list` to keep a snapshot.
+    """
+
+    __slots__ = ("times", "prices")
+
+    def __init__(self, times, prices):
+        """
+        :param memoryview times: The tick timestamps.
+        :param memoryview prices: The tick prices.
+        """
+        self.times = times
+        self.prices = prices
+
+    def __len__(self):
+        return len(self.times)
+
+    def __bool__(self):
+        return len(self.times) > 0
+
+    def __getitem__(self, item):
+        if isinstance(item, slice):
+            return TickView(self.times[item], self.prices[item])
+        return {
+            "time": self.times[item],
+            "price": self.prices[item]
+        }
+
+    def __iter__(self):
+        for timestamp, price in zip(self.times, self.prices):
+            yield {
+                "time": timestamp,
+                "price": price
+            }
+
+    def to_list(self):
+        """Copy the window as the list of `{"time", "price"}` dicts."""
+        return list(self)
+
+
+EMPTY_VIEW = TickView(memoryview(array("d")), memoryview(array("d")))
+
+
+class TickBuffer(object):
+    """Class for the fixed-capacity realtime price ring buffer of one asset.
+
+    Ticks are written twice, at `i` and `i + capacity`, in parallel
+    `array("d")` columns of `2 * capacity` items. This keeps the latest
+    ticks contiguous, so :meth:`view` is always a single zero-copy slice.
+    """
+
+    def __init__(self, capacity=10000):
+        """
+        :param int capacity: The number of ticks kept, older ones are dropped.
+        """
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self.capacity = capacity
+        self.size = 0
+        self._next = 0
+        self._times = array("d", bytes(16 * capacity))
+        self._prices = array("d", bytes(16 * capacity))
+
+    def __len__(self):
+        return self.size
+
+    def append(self, timestamp, price):
+        """Store a tick, overwriting the oldest one when full."""
+        position = self._next
+        mirror = position + self.capacity
+        self._times[position] = self._times[mirror] = timestamp
+        self._prices[position] = self._prices[mirror] = price
+        self._next = (position + 1) % self.capacity
+        if self.size < self.capacity:
+            self.size += 1
+
+    def clear(self):
+        self.size = 0
+        self._next = 0
+
+    def view(self, count=None):
+        """Get the latest ticks, oldest first, without copying.
+
+        :param int count: (optional) The number of latest ticks, default all.
+        :returns: The instance of :class:`TickView`.
+        """
+        size = self.size if count is None else max(0, min(count, self.size))
+        end = self._next if self._next >= size else self._next + self.capacity
+        start = end - size
+        return TickView(
+            memoryview(self._times)[start:end],
+            memoryview(self._prices)[start:end]
+        )
+
+    @property
+    def last(self):
+        """Get the latest tick as a `{"time", "price"}` dict or None."""
+        if not self.size:
+            return None
+        position = (self._next - 1) % self.capacity
+        return {
+            "time": self._times[position],
+            "price": self._prices[position]
+        }
@@ -0,0 +1,132 @@
+"""Module for Quotex Socket.IO packet decoder."""
+import re
+import json
+import logging
+from collections import deque
+from typing import Any, NamedTuple, Optional
+from .router import parse_packet
+
+logger = logging.getLogger(__name__)
+
+BINARY_EVENT = "45"
+BINARY_HEADER = re.compile(r"45(\d+)-(?:/[^,\[]*,)?\d*")
+
+
+class Packet(NamedTuple):
+    """A complete Socket.IO packet.
+
+    `type` is the packet prefix (`42`, `45` for binary events, or the whole
+    frame for control packets like `3` and `41`). `received_at` is the
+    `time.perf_counter()` of the first frame of the packet. `frames` is
+    the tuple of raw frames the packet was decoded from, the text frame or
+    the header and attachments of a binary event.
+    """
+    type: str
+    event: Optional[str]
+    data: Any
+    received_at: Optional[float] = None
+    frames: Optional[tuple] = None
+
+
+class PendingPacket(object):
+    """Class for a binary event waiting for its attachments."""
+
+    __slots__ = ("event", "data", "expected", "attachments", "frames", "received_at")
+
+    def __init__(self, event, data, expected, received_at, header):
+        self.event = event
+        self.data = data
+        self.expected = expected
+        self.attachments = []
+        self.frames = [header]
+        self.received_at = received_at
+
+
+def fill_placeholders(data, attachments):
+    """Replace the `{"_placeholder": true, "num": n}` objects by their attachment."""
+    if isinstance(data, dict):
+        if data.get("_placeholder") is True and "num" in data:
+            return attachments[data["num"]]
+        return {key: fill_placeholders(value, attachments) for key, value in data.items()}
+    if isinstance(data, list):
+        return [fill_placeholders(value, attachments) for value in data]
+    return data
+
+
+class PacketDecoder(object):
+    """Class for assembling Socket.IO packets from websocket frames.
+
+    A binary event arrives as a `45<n>-[...]` text header announcing `n`
+    attachments, followed by `n` binary frames. The platform sends the
+    attachments of a packet in order after its header, so headers are
+    queued and each binary frame completes the oldest pending packet.
+    Several binary events (e.g. history of several assets) can therefore
+    be in flight at once without overwriting each other.
+    """
+
+    def __init__(self, loads=json.loads, decode_binary=None):
+        """
+        :param loads: (optional) The JSON decoding function.
+        :param decode_binary: (optional) The function decoding a binary
+            attachment, default the raw bytes are kept.
+        """
+        self.loads = loads
+        self.decode_binary = decode_binary
+        self.pending = deque()
+
+    def __len__(self):
+        return len(self.pending)
+
+    def reset(self):
+        """Drop the packets still waiting for attachments, e.g. on reconnect."""
+        if self.pending:
+            logger.debug(f"Dropping {len(self.pending)} incomplete binary packets.")
+        self.pending.clear()
+
+    def feed(self, message, received_at=None):
+        """Decode a websocket frame.
+
+        :param message: The text or binary frame.
+        :param float received_at: (optional) The arrival time of the frame.
+        :returns: The complete :class:`Packet`, or None while a binary
+            event still waits for attachments.
+        """
+        if isinstance(message, (bytes, bytearray, memoryview)):
+            return self.feed_binary(message)
+        if message.startswith("45"):
+            return self.feed_header(message, received_at)
+        packet_type, event, data = parse_packet(message, self.loads)
+        return Packet(packet_type, event, data, received_at, (message,))
+
+    def feed_header(self, message, received_at):
+        match = BINARY_HEADER.match(message)
+        if match is None:
+            logger.debug(f"Malformed binary packet header: {message[:32]}")
+            return None
+        packet = self.loads(message[match.end():])
+        event = packet[0]
+        data = packet[1] if len(packet) > 1 else None
+        expected = int(match.group(1))
+        if not expected:
+            return Packet(BINARY_EVENT, event, data, received_at, (message,))
+        self.pending.append(PendingPacket(event, data, expected, received_at, message))
+        return None
+
+    def feed_binary(self, message):
+        if not self.pending:
+            logger.debug("Binary frame received without a pending packet header.")
+            return None
+        pending = self.pending[0]
+        pending.frames.append(message if isinstance(message, bytes) else bytes(message))
+        if self.decode_binary is not None:
+            try:
+                message = self.decode_binary(message)
+            except Exception:
+                self.pending.popleft()
+                raise
+        pending.attachments.append(message)
+        if len(pending.attachments) < pending.expected:
+            return None
+        self.pending.popleft()
+        data = fill_placeholders(pending.data, pending.attachments)
+        return Packet(BINARY_EVENT, pending.event, data, pending.received_at, tuple(pending.frames))
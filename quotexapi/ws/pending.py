@@ -0,0 +1,100 @@
+"""Module for Quotex websocket response futures."""
+import asyncio
+import threading
+
+
+def _set_result(future, result):
+    if not future.done():
+        future.set_result(result)
+
+
+def _set_exception(future, error):
+    if not future.done():
+        future.set_exception(error)
+
+
+class PendingResponses(object):
+    """Class for per-request futures resolved by the websocket client.
+
+    A key is whatever correlates a reply with its request: a requestId,
+    an asset name or an event name. :meth:`resolve` may be called from the
+    websocket thread, results are handed over to the loop that owns each
+    waiting future.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._waiters = {}
+
+    def expect(self, key):
+        """Register a future for the next reply matching `key`.
+
+        Register before sending the request, otherwise a fast reply can be
+        resolved before anybody is waiting for it.
+
+        :param key: The correlation key.
+        :returns: The instance of :class:`asyncio.Future`.
+        """
+        future = asyncio.get_running_loop().create_future()
+        with self._lock:
+            self._waiters.setdefault(key, []).append(future)
+        return future
+
+    def discard(self, key, future):
+        """Forget a future that is no longer awaited."""
+        with self._lock:
+            futures = self._waiters.get(key)
+            if futures and future in futures:
+                futures.remove(future)
+                if not futures:
+                    del self._waiters[key]
+
+    def is_pending(self, key):
+        with self._lock:
+            return key in self._waiters
+
+    def resolve(self, key, result):
+        """Wake every coroutine waiting on `key` with `result`.
+
+        :returns: True if somebody was waiting.
+        """
+        with self._lock:
+            futures = self._waiters.pop(key, None)
+        if not futures:
+            return False
+        for future in futures:
+            future.get_loop().call_soon_threadsafe(_set_result, future, result)
+        return True
+
+    def reject(self, key, error):
+        """Raise `error` in every coroutine waiting on `key`."""
+        with self._lock:
+            futures = self._waiters.pop(key, None)
+        for future in futures or []:
+            future.get_loop().call_soon_threadsafe(_set_exception, future, error)
+
+    async def wait(self, key, future, timeout=None):
+        """Wait for a future returned by :meth:`expect`.
+
+        :raises asyncio.TimeoutError: If nothing arrives within `timeout`.
+        """
+        try:
+            return await asyncio.wait_for(future, timeout)
+        finally:
+            self.discard(key, future)
+
+    async def wait_for_state(self, key, getter, timeout=None):
+        """Wait until `getter()` is not None, woken by replies on `key`.
+
+        :param key: The correlation key resolved when the state changes.
+        :param getter: The callable reading the state.
+        :param timeout: (optional) Seconds to wait.
+        :returns: The value returned by `getter`.
+        """
+        while getter() is None:
+            future = self.expect(key)
+            if getter() is not None:
+                self.discard(key, future)
+                break
+            await self.wait(key, future, timeout)
+        return getter()
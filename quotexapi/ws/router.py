@@ -0,0 +1,59 @@
+"""Module for Quotex websocket message router."""
+import json
+import logging
+
+logger = logging.getLogger(__name__)
+
+ANY_EVENT = "*"
+
+
+def parse_packet(message, loads=json.loads):
+    """Split a raw text frame into its Socket.IO packet parts.
+
+    :param str message: The text frame, e.g. `42["event",{...}]`.
+    :param loads: (optional) The JSON decoding function.
+    :returns: The tuple `(packet_type, event, data)`; `event` and `data`
+        are None for packets without an event.
+    """
+    if message.startswith("42"):
+        packet = loads(message[2:])
+        return "42", packet[0], packet[1] if len(packet) > 1 else None
+    if message.startswith("451-"):
+        packet = loads(message[4:])
+        return "451-", packet[0], packet[1] if len(packet) > 1 else None
+    return message, None, None
+
+
+class MessageRouter(object):
+    """Class for websocket event handlers registered by users.
+
+    Handlers are called as ``handler(event, message)`` after the built-in
+    handling of the frame. Register on :data:`ANY_EVENT` to see every event.
+    """
+
+    def __init__(self):
+        self.handlers = {}
+
+    def register(self, event, handler):
+        """Register `handler` for `event`.
+
+        :param str event: The Socket.IO event name, e.g. `quotes/stream`.
+        :param handler: The callable receiving `(event, message)`.
+        """
+        self.handlers.setdefault(event, []).append(handler)
+
+    def unregister(self, event, handler):
+        handlers = self.handlers.get(event, [])
+        if handler in handlers:
+            handlers.remove(handler)
+        if not handlers:
+            self.handlers.pop(event, None)
+
+    def dispatch(self, event, message):
+        """Call the handlers registered for `event` and :data:`ANY_EVENT`."""
+        for key in (event, ANY_EVENT):
+            for handler in self.handlers.get(key, ()):
+                try:
+                    handler(event, message)
+                except Exception as error:
+                    logger.error(f"Handler {handler} failed on {event}: {error}")
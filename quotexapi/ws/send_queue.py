@@ -0,0 +1,253 @@
+"""Module for Quotex websocket outbound queue."""
+import time
+import asyncio
+import logging
+import threading
+from collections import deque
+
+logger = logging.getLogger(__name__)
+
+PRIORITY_ORDER = 0
+PRIORITY_DEFAULT = 1
+PRIORITY_CHATTER = 2
+
+ORDER_EVENTS = ("orders/open", "orders/cancel")
+CHATTER_EVENTS = ("tick", "settings/store")
+
+
+def event_name(data):
+    """Get the Socket.IO event name of an outgoing `42[...]` frame."""
+    if isinstance(data, str) and data.startswith('42["'):
+        end = data.find('"', 4)
+        if end > 0:
+            return data[4:end]
+    return None
+
+
+def frame_priority(data):
+    """Get the lane of a frame: orders first, `tick`/`settings/store` last."""
+    name = event_name(data)
+    if name in ORDER_EVENTS:
+        return PRIORITY_ORDER
+    if name in CHATTER_EVENTS:
+        return PRIORITY_CHATTER
+    return PRIORITY_DEFAULT
+
+
+class SendQueueFull(Exception):
+    """Raised when a frame does not fit in the outbound queue."""
+
+
+class SendHandle(object):
+    """Class for withdrawing queued frames before they are written.
+
+    Frames queued with a handle are skipped by the writer once the handle
+    is cancelled, e.g. the frames of an order whose caller stopped waiting
+    for its reply. A frame already written cannot be withdrawn.
+    """
+
+    __slots__ = ("cancelled",)
+
+    def __init__(self):
+        self.cancelled = False
+
+    def cancel(self):
+        """Withdraw the frames not written yet, safe from any thread."""
+        self.cancelled = True
+
+
+class SendQueueMetrics(object):
+    """Class for outbound queue counters and send latency."""
+
+    def __init__(self):
+        self.enqueued = 0
+        self.sent = 0
+        self.dropped = 0
+        self.failed = 0
+        self.cancelled = 0
+        self.max_depth = 0
+        self.last_latency = 0.0
+        self.max_latency = 0.0
+        self.total_latency = 0.0
+
+    def record_sent(self, latency):
+        self.sent += 1
+        self.last_latency = latency
+        self.total_latency += latency
+        if latency > self.max_latency:
+            self.max_latency = latency
+
+    @property
+    def mean_latency(self):
+        return self.total_latency / self.sent if self.sent else 0.0
+
+
+class SendQueue(object):
+    """Class for the bounded, prioritised websocket send queue.
+
+    Frames are kept in one lane per priority and written by a single
+    writer task, so callers never wait on the socket. Frames of one lane
+    keep their order; frames that depend on each other, like the chart
+    settings of an order, must be queued in the same lane. When the queue
+    is full the oldest chatter frame is dropped to make room, and a frame
+    that still does not fit raises :class:`SendQueueFull`.
+
+    The writer only runs between :meth:`resume` and :meth:`pause`, i.e.
+    while the websocket is open, so frames queued during a disconnect are
+    kept until the next connection; frames that must not outlive their
+    caller, like orders, are queued with a :class:`SendHandle` and
+    withdrawn when it is cancelled. A frame that fails to be written is
+    retried `max_retries` times before it is counted as failed.
+    """
+
+    def __init__(self, writer, maxsize=1000, max_retries=3, retry_delay=0.1):
+        """
+        :param writer: The coroutine function writing one frame on the socket.
+        :param int maxsize: The maximum number of queued frames.
+        :param int max_retries: The writes attempted per frame.
+        :param float retry_delay: Seconds to wait after a failed write.
+
+        `on_sent(data, sent_at)`, if set, is called after each frame is
+        written, with the `time.perf_counter` of the write.
+        """
+        self.writer = writer
+        self.maxsize = maxsize
+        self.metrics = SendQueueMetrics()
+        self.on_sent = None
+        self.lanes = (deque(), deque(), deque())
+        self.loop = None
+        self.task = None
+        self._loop_thread_id = None
+        self.max_retries = max_retries
+        self.retry_delay = retry_delay
+        self._wakeup = asyncio.Event()
+        self._connected = asyncio.Event()
+
+    @property
+    def depth(self):
+        return sum(len(lane) for lane in self.lanes)
+
+    def stats(self):
+        """Get a snapshot of queue depth and send latency.
+
+        :returns: The dict of metrics, latencies in seconds.
+        """
+        return {
+            "depth": self.depth,
+            "depth_by_lane": {
+                "order": len(self.lanes[PRIORITY_ORDER]),
+                "default": len(self.lanes[PRIORITY_DEFAULT]),
+                "chatter": len(self.lanes[PRIORITY_CHATTER]),
+            },
+            "max_depth": self.metrics.max_depth,
+            "enqueued": self.metrics.enqueued,
+            "sent": self.metrics.sent,
+            "dropped": self.metrics.dropped,
+            "failed": self.metrics.failed,
+            "cancelled": self.metrics.cancelled,
+            "last_latency": self.metrics.last_latency,
+            "mean_latency": self.metrics.mean_latency,
+            "max_latency": self.metrics.max_latency,
+        }
+
+    def start(self):
+        """Start the writer task on the running loop."""
+        if self.task is None or self.task.done():
+            self.loop = asyncio.get_running_loop()
+            self._loop_thread_id = threading.get_ident()
+            self.task = self.loop.create_task(self.run())
+
+    def stop(self):
+        if self.task is not None:
+            self.task.cancel()
+            self.task = None
+
+    @property
+    def connected(self):
+        return self._connected.is_set()
+
+    def _call(self, callback, *args):
+        if self.loop is None or threading.get_ident() == self._loop_thread_id:
+            callback(*args)
+        else:
+            self.loop.call_soon_threadsafe(callback, *args)
+
+    def resume(self):
+        """Let the writer send, once the websocket is open; safe from any thread."""
+        self._call(self._connected.set)
+
+    def pause(self):
+        """Hold the queued frames while the websocket is down; safe from any thread."""
+        self._call(self._connected.clear)
+
+    def put(self, data, priority=None, on_sent=None, handle=None):
+        """Queue a frame, safe to call from the websocket thread.
+
+        :param str data: The websocket frame.
+        :param int priority: (optional) The lane, guessed from the event name.
+        :param on_sent: (optional) The callable called without arguments
+            once this frame is written.
+        :param handle: (optional) The :class:`SendHandle` withdrawing the
+            frame if it is cancelled before the frame is written.
+        """
+        if priority is None:
+            priority = frame_priority(data)
+        self._call(self._put, data, priority, on_sent, handle)
+
+    def _put(self, data, priority, on_sent=None, handle=None):
+        if handle is not None and handle.cancelled:
+            self.metrics.cancelled += 1
+            return
+        if self.depth >= self.maxsize:
+            if priority == PRIORITY_CHATTER:
+                self.metrics.dropped += 1
+                return
+            chatter = self.lanes[PRIORITY_CHATTER]
+            if not chatter:
+                raise SendQueueFull(f"send queue is full ({self.maxsize} frames)")
+            chatter.popleft()
+            self.metrics.dropped += 1
+        self.lanes[priority].append((time.perf_counter(), data, on_sent, handle, priority, 0))
+        self.metrics.enqueued += 1
+        self.metrics.max_depth = max(self.metrics.max_depth, self.depth)
+        self._wakeup.set()
+
+    def _pop(self):
+        for lane in self.lanes:
+            if lane:
+                return lane.popleft()
+        return None
+
+    async def run(self):
+        """Write queued frames, highest priority first, until cancelled."""
+        while True:
+            if not self._connected.is_set():
+                await self._connected.wait()
+                continue
+            item = self._pop()
+            if item is None:
+                self._wakeup.clear()
+                await self._wakeup.wait()
+                continue
+            enqueued_at, data, on_sent, handle, priority, attempts = item
+            if handle is not None and handle.cancelled:
+                self.metrics.cancelled += 1
+                continue
+            try:
+                await self.writer(data)
+            except Exception as error:
+                attempts += 1
+                if attempts < self.max_retries:
+                    logger.debug(f"Failed to send websocket frame, retrying: {error}")
+                    self.lanes[priority].appendleft((enqueued_at, data, on_sent, handle, priority, attempts))
+                    await asyncio.sleep(self.retry_delay)
+                    continue
+                self.metrics.failed += 1
+                logger.error(f"Failed to send websocket frame: {error}")
+                continue
+            sent_at = time.perf_counter()
+            self.metrics.record_sent(sent_at - enqueued_at)
+            if on_sent is not None:
+                on_sent()
+            if self.on_sent is not None:
+                self.on_sent(data, sent_at)
@@ -0,0 +1,266 @@
+"""Module for Quotex warm standby websocket."""
+import json
+import time
+import asyncio
+import logging
+from collections import deque, OrderedDict
+from .client import WebsocketClient, ROLE_ACTIVE, ROLE_STANDBY
+from .heartbeat import PING_FRAME
+from .send_queue import event_name
+
+logger = logging.getLogger(__name__)
+
+MIRROR_EVENTS = ("instruments/update", "depth/follow", "depth/unfollow", "subfor")
+
+
+def packet_key(packet):
+    """Hash a complete packet by its raw frames.
+
+    Both connections receive the same frames for the same packet, a `42`
+    text frame or the header and attachments of a `45` binary event, so
+    the native hash of the frames is enough, without walking the payload.
+    """
+    return hash(packet.frames)
+
+
+class PacketWindow(object):
+    """Class for the LRU set of the last packets, kept by hash."""
+
+    def __init__(self, size=4096):
+        """
+        :param int size: The number of packets remembered.
+        """
+        self.size = size
+        self.packets = OrderedDict()
+
+    def __len__(self):
+        return len(self.packets)
+
+    def __contains__(self, packet):
+        return packet_key(packet) in self.packets
+
+    def add(self, packet):
+        """Remember a packet, returns False if it is already in the window."""
+        key = packet_key(packet)
+        if key in self.packets:
+            self.packets.move_to_end(key)
+            return False
+        self.packets[key] = None
+        if len(self.packets) > self.size:
+            self.packets.popitem(last=False)
+        return True
+
+    def clear(self):
+        self.packets.clear()
+
+
+class WarmStandby(object):
+    """Class for a second websocket promoted when the active one drops.
+
+    The standby connection is opened next to the active one, authorized
+    with the same SSID and subscribed to the same streams; subscription
+    frames sent later on the active websocket are mirrored to it. Its
+    frames are decoded by its own :class:`PacketDecoder
+    <quotexapi.ws.packet.PacketDecoder>` and the complete packets are only
+    buffered, so the session state is driven by the active websocket alone.
+
+    When the active websocket is lost, the standby becomes the active one
+    at once, without a new handshake. The buffered packets missed by the
+    old connection are replayed and, for `switchover` seconds, packets
+    already seen in the window of the old connection are dropped. A new
+    standby is then opened in the background.
+    """
+
+    def __init__(self, api, buffer_size=256, window_size=4096, switchover=2.0, retry_delay=1.0):
+        """
+        :param api: The instance of :class:`QuotexAPI <quotexapi.api.QuotexAPI>`.
+        :param int buffer_size: The number of standby packets kept for replay.
+        :param int window_size: The number of active packets remembered to
+            drop duplicates.
+        :param float switchover: Seconds after a promotion during which
+            duplicates are dropped.
+        :param float retry_delay: Seconds before a lost standby is reopened.
+        """
+        self.api = api
+        self.buffer = deque(maxlen=buffer_size)
+        self.window = PacketWindow(window_size)
+        self.switchover = switchover
+        self.retry_delay = retry_delay
+        self.client = None
+        self.runner = None
+        self.ready = False
+        self.switched_at = None
+        self.task = None
+        self.loop = None
+        self.failovers = 0
+        self.duplicates = 0
+        self.replayed = 0
+        self._wakeup = None
+
+    def start(self):
+        """Start keeping a standby connection on the running loop."""
+        self.stop()
+        self.loop = asyncio.get_running_loop()
+        self._wakeup = asyncio.Event()
+        self.task = self.loop.create_task(self.run())
+
+    def stop(self):
+        if self.task is not None:
+            self.task.cancel()
+            self.task = None
+        self.close_standby()
+
+    def stats(self):
+        return {
+            "ready": self.ready,
+            "failovers": self.failovers,
+            "duplicates": self.duplicates,
+            "replayed": self.replayed
+        }
+
+    def wake(self, delay=0):
+        """Wake the keeper task, safe from any thread."""
+        if self.loop is None or self.loop.is_closed():
+            return
+        if delay:
+            self.loop.call_soon_threadsafe(self.loop.call_later, delay, self._wakeup.set)
+        else:
+            self.loop.call_soon_threadsafe(self._wakeup.set)
+
+    async def run(self):
+        while True:
+            client = self.client
+            if client is None:
+                if self.api.state.check_websocket_if_connect == 1:
+                    self.open_standby()
+            elif client.connected:
+                client.wss.send(PING_FRAME)
+            self._wakeup.clear()
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), self.api.heartbeat.ping_interval)
+            except asyncio.TimeoutError:
+                pass
+
+    def open_standby(self):
+        logger.debug("Opening standby websocket...")
+        self.buffer.clear()
+        self.ready = False
+        self.client = WebsocketClient(self.api, role=ROLE_STANDBY)
+        self.runner = self.api.run_websocket(self.client)
+
+    def close_standby(self):
+        client, runner = self.client, self.runner
+        self.client = self.runner = None
+        self.ready = False
+        self.buffer.clear()
+        if client is not None:
+            client.wss.close()
+        if isinstance(runner, asyncio.Task):
+            runner.cancel()
+
+    def subscription_frames(self):
+        """Build the frames subscribing the streams of the active websocket."""
+        api = self.api
+        streams = {(api.current_asset, api.current_period)}
+        assets = {api.current_asset}
+        if api.subscriptions is not None:
+            streams.update(api.subscriptions.counts)
+            assets.update(api.subscriptions.assets)
+        frames = []
+        for asset, period in streams:
+            payload = {
+                "asset": asset,
+                "period": period
+            }
+            frames.append(f'42["instruments/update", {json.dumps(payload)}]')
+        for asset in assets:
+            frames.append(f'42["depth/follow", {json.dumps(asset)}]')
+        return frames
+
+    def on_open(self, client):
+        if client is not self.client:
+            return client.wss.close()
+        client.wss.send(self.api.ssid.frame(self.api.state.SSID))
+        for frame in self.subscription_frames():
+            client.wss.send(frame)
+
+    def on_message(self, client, message, received_at=None):
+        """Method to process the frames of the standby websocket."""
+        if client is not self.client:
+            return
+        try:
+            packet = client.packets.feed(message, received_at)
+        except Exception as error:
+            logger.debug(f"Failed to decode standby message: {error}")
+            return
+        if packet is None:
+            return
+        if packet.type == "41":
+            self.lost(client)
+        elif packet.event == "s_authorization":
+            logger.debug("Standby websocket authorized.")
+            self.ready = True
+        elif packet.event == "authorization/reject":
+            logger.warning("Standby websocket token rejected.")
+            self.lost(client)
+        elif packet.event is not None:
+            self.buffer.append(packet)
+
+    def lost(self, client):
+        """Drop a standby connection that failed and open another later."""
+        if client is not self.client:
+            return
+        logger.debug("Standby websocket lost.")
+        self.close_standby()
+        self.wake(self.retry_delay)
+
+    def mirror(self, data):
+        """Send a subscription frame of the active websocket on the standby too."""
+        client = self.client
+        if client is not None and client.connected and event_name(data) in MIRROR_EVENTS:
+            client.wss.send(data)
+
+    def accept(self, packet):
+        """Record a complete packet of the active websocket.
+
+        :returns: False if the packet is a duplicate received during the switchover.
+        """
+        if self.switched_at is not None and time.monotonic() - self.switched_at > self.switchover:
+            self.switched_at = None
+        if self.window.add(packet) or self.switched_at is None:
+            return True
+        self.duplicates += 1
+        return False
+
+    def promote(self, old):
+        """Make the standby the active websocket, in place of `old`.
+
+        :returns: False if no standby is ready.
+        """
+        client = self.client
+        if client is None or not self.ready or not client.connected:
+            return False
+        api = self.api
+        runner = self.runner
+        buffered = list(self.buffer)
+        self.client = self.runner = None
+        self.ready = False
+        self.buffer.clear()
+        client.role = ROLE_ACTIVE
+        api.websocket_client = client
+        if isinstance(runner, asyncio.Task):
+            api.websocket_task = runner
+        else:
+            api.websocket_thread = runner
+        api.chart_settings_key = None
+        api.heartbeat.ping_sent_at = None
+        self.switched_at = time.monotonic()
+        self.failovers += 1
+        duplicates = self.duplicates
+        for packet in buffered:
+            client.dispatch(packet)
+        self.replayed += len(buffered) - (self.duplicates - duplicates)
+        old.wss.close()
+        logger.info("Websocket standby promovido, conexão restabelecida.")
+        self.wake()
+        return True
@@ -0,0 +1,118 @@
+"""Module for Quotex websocket stream subscriptions."""
+import logging
+from contextlib import contextmanager
+
+logger = logging.getLogger(__name__)
+
+
+class SubscriptionManager(object):
+    """Class for the reference-counted asset streams of a client.
+
+    Every `(asset, period)` stream is subscribed with `instruments/update`
+    on its first reference only, and an asset is followed with
+    `depth/follow` while any of its periods is referenced. When the last
+    reference of an asset is released, `subfor` and `depth/unfollow` are
+    sent. The manager outlives the connection: after a reconnect,
+    :meth:`replay` subscribes the exact same set again.
+
+    Persistent streams (:meth:`hold`) are counted once however many times
+    they are started; one-shot fetches use :meth:`fetch` around the request.
+    """
+
+    def __init__(self):
+        self.api = None
+        self.counts = {}
+        self.assets = {}
+        self.persistent = set()
+
+    def bind(self, api):
+        """Send the frames of new subscriptions on `api` from now on.
+
+        :param api: The instance of :class:`QuotexAPI <quotexapi.api.QuotexAPI>`.
+        """
+        self.api = api
+
+    def active(self):
+        """Get the subscribed `(asset, period)` streams."""
+        return list(self.counts)
+
+    def acquire(self, asset, period=0, refresh=False):
+        """Add a reference to a stream, subscribing it if it is new.
+
+        :param bool refresh: Send `instruments/update` even if the stream
+            is already subscribed, to get a new `history/list/v2` reply.
+        """
+        key = (asset, period)
+        count = self.counts.get(key, 0)
+        self.counts[key] = count + 1
+        self.assets[asset] = self.assets.get(asset, 0) + 1
+        if self.api is None:
+            return
+        if not count or refresh:
+            self.api.subscribe_realtime_candle(asset, period)
+        if self.assets[asset] == 1:
+            self.api.follow_candle(asset)
+
+    def release(self, asset, period=0):
+        """Remove a reference, unsubscribing the asset after its last one."""
+        key = (asset, period)
+        count = self.counts.get(key, 0)
+        if not count:
+            return
+        if count == 1:
+            del self.counts[key]
+        else:
+            self.counts[key] = count - 1
+        self.assets[asset] -= 1
+        if self.assets[asset]:
+            return
+        del self.assets[asset]
+        if self.api is not None:
+            logger.debug(f"Unsubscribing {asset}.")
+            self.api.unsubscribe_realtime_candle(asset)
+            self.api.unfollow_candle(asset)
+
+    def hold(self, asset, period=0, refresh=False):
+        """Keep a stream subscribed until :meth:`drop`, idempotent.
+
+        :returns: True if the stream was not held yet.
+        """
+        key = (asset, period)
+        if key in self.persistent:
+            if refresh and self.api is not None:
+                self.api.subscribe_realtime_candle(asset, period)
+            return False
+        self.persistent.add(key)
+        self.acquire(asset, period, refresh)
+        return True
+
+    def drop(self, asset, period=None):
+        """Release the persistent streams of `asset`, of every period by default."""
+        for key in [key for key in self.persistent if key[0] == asset]:
+            if period is None or key[1] == period:
+                self.persistent.discard(key)
+                self.release(*key)
+
+    @contextmanager
+    def fetch(self, asset, period=0, refresh=False):
+        """Reference a stream for the duration of a one-shot request.
+
+        Usage::
+
+            with subscriptions.fetch(asset, period):
+                ...
+        """
+        self.acquire(asset, period, refresh)
+        try:
+            yield
+        finally:
+            self.release(asset, period)
+
+    def replay(self):
+        """Subscribe every referenced stream again, e.g. after a reconnect."""
+        if self.api is None:
+            return
+        for asset, period in list(self.counts):
+            self.api.subscribe_realtime_candle(asset, period)
+        for asset in list(self.assets):
+            self.api.follow_candle(asset)
@@ -0,0 +1,95 @@
+"""Module for Quotex websocket reconnect supervisor."""
+import random
+import asyncio
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class ReconnectSupervisor(object):
+    """Class for reconnecting a client whenever its websocket drops.
+
+    The supervisor sleeps until the connection is lost (socket closed or a
+    `41` packet from the platform), then calls :meth:`QuotexAPI.reconnect
+    <quotexapi.api.QuotexAPI.reconnect>` with jittered exponential backoff
+    until it succeeds. The same API object is kept, so the SSID, pending
+    orders, deal trackers and stream subscriptions survive the reconnect.
+    """
+
+    def __init__(self, client, base_delay=1.0, max_delay=60.0, factor=2.0, max_attempts=None):
+        """
+        :param client: The instance of :class:`Quotex <quotexapi.stable_api.Quotex>`.
+        :param float base_delay: The delay before the first attempt, in seconds.
+        :param float max_delay: The maximum delay between attempts.
+        :param float factor: The delay growth per failed attempt.
+        :param int max_attempts: (optional) Give up after this many failed
+            attempts in a row, default never.
+        """
+        self.client = client
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.factor = factor
+        self.max_attempts = max_attempts
+        self.task = None
+        self.disconnects = 0
+        self.reconnects = 0
+        self.failed_attempts = 0
+
+    def backoff(self, attempt):
+        """Get the delay before attempt number `attempt`, from 0.
+
+        Half of the exponential delay is fixed and half is random, so many
+        clients dropped together do not reconnect in lockstep.
+        """
+        delay = min(self.max_delay, self.base_delay * self.factor ** attempt)
+        return delay / 2 + random.uniform(0, delay / 2)
+
+    def start(self):
+        """Start supervising on the running loop."""
+        if self.task is None or self.task.done():
+            self.task = asyncio.get_running_loop().create_task(self.run())
+        return self.task
+
+    def stop(self):
+        if self.task is not None:
+            self.task.cancel()
+            self.task = None
+
+    def stats(self):
+        """Get the reconnect counters and the time to data histogram, in seconds."""
+        api = self.client.api
+        return {
+            "disconnects": self.disconnects,
+            "reconnects": self.reconnects,
+            "failed_attempts": self.failed_attempts,
+            "time_to_data": api.time_to_data.to_dict() if api is not None else None
+        }
+
+    async def run(self):
+        """Reconnect after every disconnect, until cancelled."""
+        while True:
+            api = self.client.api
+            await api.pending.wait_for_state(
+                "disconnect",
+                lambda: True if api.state.check_websocket_if_connect == 0 else None
+            )
+            self.disconnects += 1
+            attempt = 0
+            while True:
+                delay = self.backoff(attempt)
+                logger.info(f"Websocket desconectado, reconectando em {delay:.1f} segundos...")
+                await asyncio.sleep(delay)
+                try:
+                    check, reason = await api.reconnect()
+                except Exception as error:
+                    check, reason = False, str(error)
+                if check and api.state.check_websocket_if_connect == 1:
+                    self.reconnects += 1
+                    logger.info("Websocket reconectado.")
+                    break
+                self.failed_attempts += 1
+                attempt += 1
+                logger.warning(f"Reconnect attempt {attempt} failed: {reason}")
+                if self.max_attempts and attempt >= self.max_attempts:
+                    logger.error(f"Giving up reconnecting after {attempt} attempts.")
+                    return
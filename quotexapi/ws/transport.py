@@ -0,0 +1,266 @@
+"""Module for Quotex websocket transports."""
+import asyncio
+import logging
+import threading
+import websocket
+from collections import deque
+
+try:
+    from websockets.asyncio.client import connect as ws_connect
+    HEADERS_ARGUMENT = "additional_headers"
+except ImportError:
+    try:
+        from websockets.client import connect as ws_connect
+        HEADERS_ARGUMENT = "extra_headers"
+    except ImportError:
+        ws_connect = None
+        HEADERS_ARGUMENT = None
+
+try:
+    from websockets.frames import DATA_OPCODES
+    from websockets.extensions.permessage_deflate import (
+        PerMessageDeflate,
+        ClientPerMessageDeflateFactory
+    )
+except ImportError:
+    PerMessageDeflate = ClientPerMessageDeflateFactory = None
+
+logger = logging.getLogger(__name__)
+
+TRANSPORT_THREAD = "thread"
+TRANSPORT_ASYNCIO = "asyncio"
+TRANSPORTS = (TRANSPORT_THREAD, TRANSPORT_ASYNCIO)
+
+
+if PerMessageDeflate is not None:
+    class MeteredPerMessageDeflate(PerMessageDeflate):
+        """permessage-deflate extension reporting the size of each message on the wire."""
+
+        def __init__(self, *args, app=None):
+            super().__init__(*args)
+            self.app = app
+            self.received_size = 0
+            self.received_wire_size = 0
+
+        def decode(self, frame, *, max_size=None):
+            if frame.opcode not in DATA_OPCODES:
+                return super().decode(frame, max_size=max_size)
+            self.received_wire_size += len(frame.data)
+            frame = super().decode(frame, max_size=max_size)
+            self.received_size += len(frame.data)
+            if frame.fin:
+                self.app.received_sizes.append((self.received_size, self.received_wire_size))
+                self.received_size = self.received_wire_size = 0
+            return frame
+
+        def encode(self, frame):
+            if frame.opcode not in DATA_OPCODES:
+                return super().encode(frame)
+            size = len(frame.data)
+            frame = super().encode(frame)
+            self.app.sent_sizes.append((size, len(frame.data)))
+            return frame
+
+    class MeteredDeflateFactory(ClientPerMessageDeflateFactory):
+        """Client permessage-deflate offer building :class:`MeteredPerMessageDeflate`."""
+
+        def __init__(self, app, **kwargs):
+            super().__init__(**kwargs)
+            self.app = app
+
+        def process_response_params(self, params, accepted_extensions):
+            extension = super().process_response_params(params, accepted_extensions)
+            logger.debug("permessage-deflate negotiated.")
+            return MeteredPerMessageDeflate(
+                extension.remote_no_context_takeover,
+                extension.local_no_context_takeover,
+                extension.remote_max_window_bits,
+                extension.local_max_window_bits,
+                self.compress_settings,
+                app=self.app
+            )
+else:
+    MeteredDeflateFactory = None
+
+
+class ThreadWebSocketApp(websocket.WebSocketApp):
+    """:class:`websocket.WebSocketApp` calling `on_sent` after each frame.
+
+    websocket-client does not implement permessage-deflate, so frames are
+    sent uncompressed and `wire_size` is always None.
+    """
+
+    on_sent = None
+
+    def send(self, data, opcode=websocket.ABNF.OPCODE_TEXT):
+        super().send(data, opcode)
+        if self.on_sent is not None:
+            self.on_sent(self, data, None)
+
+
+class AsyncWebSocketApp(object):
+    """Asyncio counterpart of :class:`websocket.WebSocketApp`.
+
+    Reading, writing, ping/pong and reconnect all run as tasks on the
+    event loop. The callbacks keep the ``WebSocketApp`` signatures, so
+    :class:`WebsocketClient <quotexapi.ws.client.WebsocketClient>` drives
+    both transports with the same handlers.
+    """
+
+    def __init__(self,
+                 url,
+                 on_message=None,
+                 on_error=None,
+                 on_close=None,
+                 on_open=None,
+                 on_ping=None,
+                 on_pong=None,
+                 header=None,
+                 compression=True):
+        """
+        :param str url: The websocket url.
+        :param header: The dict of handshake headers.
+        :param bool compression: Offer permessage-deflate to the server.
+
+        `on_sent(app, data, wire_size)`, if set, is called after each frame
+        is written. While a frame is dispatched to `on_message`,
+        :attr:`received_size` holds its `(size, wire_size)` when
+        permessage-deflate is active, None otherwise.
+        """
+        if ws_connect is None:
+            raise ImportError(
+                "The asyncio transport requires the `websockets` package: "
+                "pip install websockets"
+            )
+        self.url = url
+        self.header = header or {}
+        self.on_message = on_message
+        self.on_error = on_error
+        self.on_close = on_close
+        self.on_open = on_open
+        self.on_ping = on_ping
+        self.on_pong = on_pong
+        self.on_sent = None
+        self.compression = compression
+        self.received_sizes = deque()
+        self.sent_sizes = deque()
+        self.received_size = None
+        self.connection = None
+        self.keep_running = False
+        self.loop = None
+        self._loop_thread_id = None
+        self._outbox = asyncio.Queue()
+
+    def send(self, data):
+        """Queue a frame for the writer task, safe from any thread.
+
+        :param data: The text or binary frame.
+        """
+        if self.loop is None or threading.get_ident() == self._loop_thread_id:
+            self._outbox.put_nowait(data)
+        else:
+            self.loop.call_soon_threadsafe(self._outbox.put_nowait, data)
+
+    async def send_async(self, data):
+        """Write a frame on the socket and wait until it is flushed.
+
+        :param data: The text or binary frame.
+        """
+        await self.connection.send(data)
+        self._sent(data)
+
+    def _sent(self, data):
+        wire_size = self.sent_sizes.popleft()[1] if self.sent_sizes else None
+        if self.on_sent is not None:
+            self.on_sent(self, data, wire_size)
+
+    def close(self):
+        """Stop reconnecting and close the current connection."""
+        self.keep_running = False
+        if self.connection is not None and self.loop is not None:
+            asyncio.run_coroutine_threadsafe(self.connection.close(), self.loop)
+
+    def _callback(self, callback, *args):
+        if callback:
+            try:
+                callback(self, *args)
+            except Exception as error:
+                logger.error(f"error from callback {callback}: {error}")
+                if self.on_error and callback is not self.on_error:
+                    self.on_error(self, error)
+
+    def _connect_options(self, ping_interval, ping_timeout, ssl_context):
+        headers = dict(self.header)
+        origin = headers.pop("Origin", None)
+        user_agent = headers.pop("User-Agent", None)
+        headers.pop("Host", None)
+        options = {
+            HEADERS_ARGUMENT: headers,
+            "origin": origin,
+            "user_agent_header": user_agent,
+            "ping_interval": ping_interval,
+            "ping_timeout": ping_timeout,
+            "max_size": None,
+            "compression": None,
+        }
+        if self.compression and MeteredDeflateFactory is not None:
+            options["extensions"] = [MeteredDeflateFactory(self, compress_settings={"memLevel": 5})]
+        if self.url.startswith("wss://"):
+            options["ssl"] = ssl_context
+        return options
+
+    async def _writer(self, connection):
+        while True:
+            data = await self._outbox.get()
+            await connection.send(data)
+            self._sent(data)
+
+    async def run_forever(self,
+                          ping_interval=24,
+                          ping_timeout=20,
+                          ssl_context=None,
+                          reconnect=0):
+        """Connect and dispatch frames until :meth:`close` is called.
+
+        :param int ping_interval: Seconds between websocket pings.
+        :param int ping_timeout: Seconds to wait for the matching pong.
+        :param ssl_context: The :class:`ssl.SSLContext` for ``wss`` urls.
+        :param int reconnect: Seconds to wait before reconnecting, 0 disables it.
+        """
+        self.loop = asyncio.get_running_loop()
+        self._loop_thread_id = threading.get_ident()
+        self.keep_running = True
+        options = self._connect_options(ping_interval, ping_timeout, ssl_context)
+        while self.keep_running:
+            close_code, close_reason = None, None
+            # Frames can be decoded as soon as the handshake is done, so the
+            # counters of the previous connection are dropped before it starts.
+            self.received_sizes.clear()
+            self.sent_sizes.clear()
+            try:
+                async with ws_connect(self.url, **options) as connection:
+                    self.connection = connection
+                    writer = asyncio.create_task(self._writer(connection))
+                    self._callback(self.on_open)
+                    try:
+                        async for message in connection:
+                            sizes = self.received_sizes
+                            self.received_size = sizes.popleft() if sizes else None
+                            self._callback(self.on_message, message)
+                    finally:
+                        writer.cancel()
+                close_code = connection.close_code
+                close_reason = connection.close_reason
+            except asyncio.CancelledError:
+                self.keep_running = False
+                raise
+            except Exception as error:
+                self._callback(self.on_error, error)
+            finally:
+                self.connection = None
+            self._callback(self.on_close, close_code, close_reason)
+            if not reconnect or not self.keep_running:
+                break
+            logger.info(f"Websocket reconnecting in {reconnect} seconds...")
+            await asyncio.sleep(reconnect)
+        self.keep_running = False
@@ -33,6 +33,10 @@ setup(
         'pyfiglet',
         'numpy'
     ],
+    extras_require={
+        "asyncio": ["websockets>=11"],
+        "fast": ["orjson"],
+    },
     classifiers=[
         'Development Status :: 3 - Alpha',
         'Intended Audience :: Developers',